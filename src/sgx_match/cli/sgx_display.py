@@ -1,24 +1,141 @@
 """Display utilities for SGX trade matching results."""
 
+from itertools import islice
 from typing import Any
-from rich.console import Console, Group
-from rich.table import Table
+from rich.console import Console, Group, JustifyMethod, NewLine, RenderableType
+from rich.style import Style
+from rich.table import Column, Table
 from rich.panel import Panel
 from rich.text import Text
 from rich import box
 
-from ..models import SGXMatchResult, SGXTrade
+from ..models import SGXMatchResult, SGXMatchType, SGXTrade
 
 # Display configuration constants
 MAX_UNMATCHED_DISPLAY = 100  # Maximum unmatched trades to show
+CONFIDENCE_FMT = "%s%%"  # Confidence cell, e.g. "100%"
+RATE_FMT = "%.1f%%"  # Percentage cell with one decimal, e.g. "97.5%"
+
+# Shared console so every SGXDisplay reuses one Rich render pipeline
+_CONSOLE = Console()
+
+# Column styles parsed once instead of per render
+_NO_STYLE = Style.null()
+_CYAN = Style.parse("cyan")
+_GREEN = Style.parse("green")
+_YELLOW = Style.parse("yellow")
+_BLUE = Style.parse("blue")
+_MAGENTA = Style.parse("magenta")
+_DIM = Style.parse("dim")
+_BOLD = Style.parse("bold")
+_BOLD_GREEN = Style.parse("bold green")
+_BOLD_RED = Style.parse("bold red")
+_BOLD_YELLOW = Style.parse("bold yellow")
+
+# Static table schemas: (header, justify, style) per column
+ColumnSpec = tuple[str, JustifyMethod, Style]
+
+_STATISTICS_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("Metric", "left", _CYAN),
+    ("Trader", "right", _NO_STYLE),
+    ("Exchange", "right", _NO_STYLE),
+    ("Total", "right", _NO_STYLE),
+)
+
+_SINGLE_LEG_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("Match ID", "left", _CYAN),
+    ("Rule", "center", _NO_STYLE),
+    ("Product", "left", _GREEN),
+    ("Contract", "left", _YELLOW),
+    ("Quantity", "right", _BLUE),
+    ("Price", "right", _MAGENTA),
+    ("B/S", "center", _NO_STYLE),
+    ("Trade ID (T)", "left", _DIM),
+    ("Trade ID (E)", "left", _DIM),
+    ("Status", "left", _YELLOW),
+    ("Confidence", "right", _BOLD_GREEN),
+)
+
+_SPREAD_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("Match ID", "left", _CYAN),
+    ("Rule", "center", _NO_STYLE),
+    ("Product", "left", _GREEN),
+    ("Contracts", "left", _YELLOW),
+    ("Quantity", "right", _BLUE),
+    ("Spread Price", "right", _MAGENTA),
+    ("Directions", "center", _NO_STYLE),
+    ("Trade IDs (T)", "left", _DIM),
+    ("Trade IDs (E)", "left", _DIM),
+    ("Status", "left", _YELLOW),
+    ("Confidence", "right", _BOLD_GREEN),
+)
+
+_PRODUCT_SPREAD_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("Match ID", "left", _CYAN),
+    ("Rule", "center", _NO_STYLE),
+    ("Products", "left", _GREEN),
+    ("Contract", "left", _YELLOW),
+    ("Quantity", "right", _BLUE),
+    ("Spread Price", "right", _MAGENTA),
+    ("Directions", "center", _NO_STYLE),
+    ("Trade IDs (T)", "left", _DIM),
+    ("Trade IDs (E)", "left", _DIM),
+    ("Status", "left", _YELLOW),
+    ("Confidence", "right", _BOLD_GREEN),
+)
+
+_UNMATCHED_TRADER_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("ID", "left", _CYAN),
+    ("Product", "left", _GREEN),
+    ("Contract", "left", _YELLOW),
+    ("Quantity", "right", _BLUE),
+    ("Price", "right", _MAGENTA),
+    ("B/S", "center", _NO_STYLE),
+    ("Trade Time", "left", _DIM),
+    ("Broker Group", "right", _NO_STYLE),
+)
+
+_UNMATCHED_EXCHANGE_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("ID", "left", _CYAN),
+    ("Deal ID", "right", _NO_STYLE),
+    ("Product", "left", _GREEN),
+    ("Contract", "left", _YELLOW),
+    ("Quantity", "right", _BLUE),
+    ("Price", "right", _MAGENTA),
+    ("B/S", "center", _NO_STYLE),
+    ("Trader ID", "left", _DIM),
+)
+
+_RULES_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("Rule", "center", _CYAN),
+    ("Name", "left", _BOLD),
+    ("Type", "left", _GREEN),
+    ("Confidence", "right", _YELLOW),
+    ("Description", "left", _DIM),
+)
+
+
+def _build_table(title: str, columns: tuple[ColumnSpec, ...]) -> Table:
+    """Create a rounded table with fresh columns from a static schema.
+
+    Columns hold their own cell lists, so a new Column is created per table.
+    """
+    return Table(
+        *(
+            Column(header, justify=justify, style=style)
+            for header, justify, style in columns
+        ),
+        title=title,
+        box=box.ROUNDED,
+    )
 
 
 class SGXDisplay:
     """Rich console display for SGX matching results."""
 
     def __init__(self) -> None:
-        """Initialize display with Rich console."""
-        self.console = Console()
+        """Initialize display with the shared Rich console."""
+        self.console = _CONSOLE
 
     def show_header(self) -> None:
         """Display SGX matching system header."""
@@ -46,105 +163,119 @@ class SGXDisplay:
             matches: List of match results
             statistics: Matching statistics
         """
-        # Summary statistics
-        self._show_statistics(statistics)
+        # Collect every section and render them in a single print call
+        renderables: list[RenderableType] = [
+            NewLine(2),
+            self._build_statistics_table(statistics),
+        ]
 
         # Detailed matches
         if matches:
-            self._show_detailed_matches(matches)
+            renderables.extend(self._build_detailed_match_renderables(matches))
         else:
-            self.console.print("\n[yellow]No matches found.[/yellow]")
-
-    def _show_statistics(self, stats: dict[str, Any]) -> None:
-        """Show matching statistics."""
-        table = Table(title="Matching Statistics", box=box.ROUNDED)
-        table.add_column("Metric", style="cyan")
-        table.add_column("Trader", justify="right")
-        table.add_column("Exchange", justify="right")
-        table.add_column("Total", justify="right")
+            renderables.append(Text.from_markup("\n[yellow]No matches found.[/yellow]"))
+
+        self.console.print(Group(*renderables))
+
+    def _build_statistics_table(self, stats: dict[str, Any]) -> Table:
+        """Build the matching statistics table."""
+        original_trader = stats.get("original_trader_count", 0)
+        original_exchange = stats.get("original_exchange_count", 0)
+        matched_trader = stats.get("matched_trader_count", 0)
+        matched_exchange = stats.get("matched_exchange_count", 0)
+        unmatched_trader = stats.get("unmatched_trader_count", 0)
+        unmatched_exchange = stats.get("unmatched_exchange_count", 0)
+        total_matches = stats.get("total_matches", 0)
+        trader_match_rate = stats.get("trader_match_rate", 0)
+        exchange_match_rate = stats.get("exchange_match_rate", 0)
+        original_total = original_trader + original_exchange
+        overall_match_rate = total_matches / max(original_total, 1) * 100
+
+        table = _build_table("Matching Statistics", _STATISTICS_COLUMNS)
 
         table.add_row(
             "Original Count",
-            str(stats.get("original_trader_count", 0)),
-            str(stats.get("original_exchange_count", 0)),
-            str(
-                stats.get("original_trader_count", 0)
-                + stats.get("original_exchange_count", 0)
-            ),
+            str(original_trader),
+            str(original_exchange),
+            str(original_total),
         )
 
         table.add_row(
             "Matched Count",
-            str(stats.get("matched_trader_count", 0)),
-            str(stats.get("matched_exchange_count", 0)),
-            str(stats.get("total_matches", 0)),
+            str(matched_trader),
+            str(matched_exchange),
+            str(total_matches),
         )
 
         table.add_row(
             "Unmatched Count",
-            str(stats.get("unmatched_trader_count", 0)),
-            str(stats.get("unmatched_exchange_count", 0)),
-            str(
-                stats.get("unmatched_trader_count", 0)
-                + stats.get("unmatched_exchange_count", 0)
-            ),
+            str(unmatched_trader),
+            str(unmatched_exchange),
+            str(unmatched_trader + unmatched_exchange),
         )
 
         table.add_row(
             "Match Rate",
-            f"{stats.get('trader_match_rate', 0):.1f}%",
-            f"{stats.get('exchange_match_rate', 0):.1f}%",
-            f"{(stats.get('total_matches', 0) / max(stats.get('original_trader_count', 0) + stats.get('original_exchange_count', 0), 1)) * 100:.1f}%",
+            RATE_FMT % trader_match_rate,
+            RATE_FMT % exchange_match_rate,
+            RATE_FMT % overall_match_rate,
         )
 
-        self.console.print("\n")
-        self.console.print(table)
+        return table
 
     def _show_detailed_matches(self, matches: list[SGXMatchResult]) -> None:
         """Show detailed match results, separating single-leg and multi-leg matches."""
         if not matches:
             return
 
+        self.console.print(Group(*self._build_detailed_match_renderables(matches)))
+
+    def _build_detailed_match_renderables(
+        self, matches: list[SGXMatchResult]
+    ) -> list[RenderableType]:
+        """Build the match tables, separating single-leg and multi-leg matches."""
+        renderables: list[RenderableType] = []
+
         # Separate single-leg and multi-leg matches in a single pass
-        single_leg_matches = []
-        spread_matches = []
-        product_spread_matches = []
+        single_leg_matches: list[SGXMatchResult] = []
+        spread_matches: list[SGXMatchResult] = []
+        product_spread_matches: list[SGXMatchResult] = []
+        single_leg_append = single_leg_matches.append
+        spread_append = spread_matches.append
+        product_spread_append = product_spread_matches.append
 
         for match in matches:
             if match.additional_trader_trades or match.additional_exchange_trades:
-                if match.match_type.value == "spread":
-                    spread_matches.append(match)
-                elif match.match_type.value == "product_spread":
-                    product_spread_matches.append(match)
+                match_type = match.match_type
+                if match_type is SGXMatchType.SPREAD:
+                    spread_append(match)
+                elif match_type is SGXMatchType.PRODUCT_SPREAD:
+                    product_spread_append(match)
             else:
-                single_leg_matches.append(match)
+                single_leg_append(match)
 
-        # Show single-leg matches
+        # Single-leg matches
         if single_leg_matches:
-            self._show_single_leg_matches(single_leg_matches)
+            renderables.append(NewLine(2))
+            renderables.append(self._build_single_leg_table(single_leg_matches))
 
-        # Show spread matches
+        # Spread matches
         if spread_matches:
-            self._show_spread_matches(spread_matches)
+            renderables.append(NewLine(2))
+            renderables.append(self._build_spread_table(spread_matches))
 
-        # Show product spread matches
+        # Product spread matches
         if product_spread_matches:
-            self._show_product_spread_matches(product_spread_matches)
-
-    def _show_single_leg_matches(self, matches: list[SGXMatchResult]) -> None:
-        """Show single-leg match results."""
-        table = Table(title=f"Detailed Matches ({len(matches)} found)", box=box.ROUNDED)
-        table.add_column("Match ID", style="cyan")
-        table.add_column("Rule", justify="center")
-        table.add_column("Product", style="green")
-        table.add_column("Contract", style="yellow")
-        table.add_column("Quantity", justify="right", style="blue")
-        table.add_column("Price", justify="right", style="magenta")
-        table.add_column("B/S", justify="center")
-        table.add_column("Trade ID (T)", style="dim")
-        table.add_column("Trade ID (E)", style="dim")
-        table.add_column("Status", style="yellow")
-        table.add_column("Confidence", justify="right", style="bold green")
+            renderables.append(NewLine(2))
+            renderables.append(self._build_product_spread_table(product_spread_matches))
+
+        return renderables
+
+    def _build_single_leg_table(self, matches: list[SGXMatchResult]) -> Table:
+        """Build the single-leg match results table."""
+        table = _build_table(
+            f"Detailed Matches ({len(matches)} found)", _SINGLE_LEG_COLUMNS
+        )
 
         for match in matches:
             table.add_row(
@@ -158,47 +289,36 @@ class SGXDisplay:
                 match.trader_trade.display_id,
                 match.exchange_trade.display_id,
                 match.status.value.title() if match.status else "Matched",
-                f"{match.confidence}%",
+                CONFIDENCE_FMT % match.confidence,
             )
 
-        self.console.print("\n")
-        self.console.print(table)
+        return table
 
-    def _show_spread_matches(self, matches: list[SGXMatchResult]) -> None:
-        """Show multi-leg match results (spreads)."""
+    def _build_spread_table(self, matches: list[SGXMatchResult]) -> Table:
+        """Build the multi-leg match results table (spreads)."""
         # Import here to avoid circular imports
         from ..utils.trade_helpers import get_month_order_tuple
 
-        table = Table(title=f"Spread Matches ({len(matches)} found)", box=box.ROUNDED)
-        table.add_column("Match ID", style="cyan")
-        table.add_column("Rule", justify="center")
-        table.add_column("Product", style="green")
-        table.add_column("Contracts", style="yellow")
-        table.add_column("Quantity", justify="right", style="blue")
-        table.add_column("Spread Price", justify="right", style="magenta")
-        table.add_column("Directions", justify="center")
-        table.add_column("Trade IDs (T)", style="dim")
-        table.add_column("Trade IDs (E)", style="dim")
-        table.add_column("Status", style="yellow")
-        table.add_column("Confidence", justify="right", style="bold green")
+        table = _build_table(f"Spread Matches ({len(matches)} found)", _SPREAD_COLUMNS)
+
+        # Sort trades chronologically by contract month for consistent display
+        # Handle None return values by providing a fallback sort key
+        def sort_key(trade: SGXTrade) -> tuple[int, int]:
+            order_tuple = get_month_order_tuple(trade.contract_month)
+            return (
+                order_tuple if order_tuple is not None else (9999, 99)
+            )  # Put invalid dates last
 
         for match in matches:
             # Get all trades
-            all_trader_trades = [match.trader_trade] + match.additional_trader_trades
-            all_exchange_trades = [
-                match.exchange_trade
-            ] + match.additional_exchange_trades
-
-            # Sort trades chronologically by contract month for consistent display
-            # Handle None return values by providing a fallback sort key
-            def sort_key(trade: SGXTrade) -> tuple[int, int]:
-                order_tuple = get_month_order_tuple(trade.contract_month)
-                return (
-                    order_tuple if order_tuple is not None else (9999, 99)
-                )  # Put invalid dates last
-
-            all_trader_trades.sort(key=sort_key)
-            all_exchange_trades.sort(key=sort_key)
+            trader_trade = match.trader_trade
+            all_trader_trades = sorted(
+                (trader_trade, *match.additional_trader_trades), key=sort_key
+            )
+            all_exchange_trades = sorted(
+                (match.exchange_trade, *match.additional_exchange_trades),
+                key=sort_key,
+            )
 
             # Format trader IDs (in chronological order)
             trader_ids = " + ".join([trade.display_id for trade in all_trader_trades])
@@ -220,7 +340,7 @@ class SGXDisplay:
             )
 
             # Use spread price from trader (should be same for both legs in new pattern)
-            spread_price = match.trader_trade.price
+            spread_price = trader_trade.price
 
             table.add_row(
                 match.match_id,
@@ -233,41 +353,34 @@ class SGXDisplay:
                 trader_ids,
                 exchange_ids,
                 match.status.value.title() if match.status else "Matched",
-                f"{match.confidence}%",
+                CONFIDENCE_FMT % match.confidence,
             )
 
-        self.console.print("\n")
-        self.console.print(table)
+        return table
 
-    def _show_product_spread_matches(self, matches: list[SGXMatchResult]) -> None:
-        """Show product spread match results."""
+    def _build_product_spread_table(self, matches: list[SGXMatchResult]) -> Table:
+        """Build the product spread match results table."""
         # Import here to avoid circular imports
 
-        table = Table(
-            title=f"Product Spread Matches ({len(matches)} found)", box=box.ROUNDED
+        table = _build_table(
+            f"Product Spread Matches ({len(matches)} found)", _PRODUCT_SPREAD_COLUMNS
         )
-        table.add_column("Match ID", style="cyan")
-        table.add_column("Rule", justify="center")
-        table.add_column("Products", style="green")
-        table.add_column("Contract", style="yellow")
-        table.add_column("Quantity", justify="right", style="blue")
-        table.add_column("Spread Price", justify="right", style="magenta")
-        table.add_column("Directions", justify="center")
-        table.add_column("Trade IDs (T)", style="dim")
-        table.add_column("Trade IDs (E)", style="dim")
-        table.add_column("Status", style="yellow")
-        table.add_column("Confidence", justify="right", style="bold green")
+
+        def product_key(trade: SGXTrade) -> str:
+            return trade.product_name
 
         for match in matches:
             # Get all trades
-            all_trader_trades = [match.trader_trade] + match.additional_trader_trades
-            all_exchange_trades = [
-                match.exchange_trade
-            ] + match.additional_exchange_trades
+            trader_trade = match.trader_trade
 
             # Sort trades alphabetically by product for consistent display
-            all_trader_trades.sort(key=lambda t: t.product_name)
-            all_exchange_trades.sort(key=lambda t: t.product_name)
+            all_trader_trades = sorted(
+                (trader_trade, *match.additional_trader_trades), key=product_key
+            )
+            all_exchange_trades = sorted(
+                (match.exchange_trade, *match.additional_exchange_trades),
+                key=product_key,
+            )
 
             # Format trader IDs (in alphabetical product order)
             trader_ids = " + ".join([trade.display_id for trade in all_trader_trades])
@@ -289,10 +402,10 @@ class SGXDisplay:
             )
 
             # Use spread price from trader (should be same for both legs in product spread)
-            spread_price = match.trader_trade.price
+            spread_price = trader_trade.price
 
             # Contract month should be same for all trades
-            contract_month = match.trader_trade.contract_month
+            contract_month = trader_trade.contract_month
 
             table.add_row(
                 match.match_id,
@@ -305,11 +418,10 @@ class SGXDisplay:
                 trader_ids,
                 exchange_ids,
                 match.status.value.title() if match.status else "Matched",
-                f"{match.confidence}%",
+                CONFIDENCE_FMT % match.confidence,
             )
 
-        self.console.print("\n")
-        self.console.print(table)
+        return table
 
     def show_unmatched_trades(
         self, trader_trades: list[SGXTrade], exchange_trades: list[SGXTrade]
@@ -320,29 +432,43 @@ class SGXDisplay:
             trader_trades: Unmatched trader trades
             exchange_trades: Unmatched exchange trades
         """
+        if not trader_trades and not exchange_trades:
+            return
+
+        renderables: list[RenderableType] = []
         if trader_trades:
-            self._show_unmatched_trader_table(trader_trades)
+            renderables.append(NewLine(2))
+            renderables.append(self._build_unmatched_trader_table(trader_trades))
 
         if exchange_trades:
-            self._show_unmatched_exchange_table(exchange_trades)
+            renderables.append(NewLine(2))
+            renderables.append(self._build_unmatched_exchange_table(exchange_trades))
+
+        self.console.print(Group(*renderables))
 
     def _show_unmatched_trader_table(self, trades: list[SGXTrade]) -> None:
         """Show unmatched trader trades table."""
-        min(len(trades), MAX_UNMATCHED_DISPLAY)
-        title = f"Unmatched Trader Trades ({len(trades)})"
-        if len(trades) > MAX_UNMATCHED_DISPLAY:
-            title += f" - Showing first {MAX_UNMATCHED_DISPLAY}"
-        table = Table(title=title, box=box.ROUNDED)
-        table.add_column("ID", style="cyan")
-        table.add_column("Product", style="green")
-        table.add_column("Contract", style="yellow")
-        table.add_column("Quantity", justify="right", style="blue")
-        table.add_column("Price", justify="right", style="magenta")
-        table.add_column("B/S", justify="center")
-        table.add_column("Trade Time", style="dim")
-        table.add_column("Broker Group", justify="right")
-
-        for trade in trades[:MAX_UNMATCHED_DISPLAY]:  # Limit display for performance
+        self.console.print(
+            Group(NewLine(2), self._build_unmatched_trader_table(trades))
+        )
+
+    def _show_unmatched_exchange_table(self, trades: list[SGXTrade]) -> None:
+        """Show unmatched exchange trades table."""
+        self.console.print(
+            Group(NewLine(2), self._build_unmatched_exchange_table(trades))
+        )
+
+    def _build_unmatched_trader_table(self, trades: list[SGXTrade]) -> Table:
+        """Build unmatched trader trades table."""
+        n = len(trades)
+        limit = MAX_UNMATCHED_DISPLAY
+        title = f"Unmatched Trader Trades ({n})"
+        if n > limit:
+            title += f" - Showing first {limit}"
+        table = _build_table(title, _UNMATCHED_TRADER_COLUMNS)
+
+        # Limit display for performance without copying the full list
+        for trade in islice(trades, limit):
             table.add_row(
                 trade.display_id,
                 trade.product_name,
@@ -354,26 +480,19 @@ class SGXDisplay:
                 str(trade.broker_group_id or ""),
             )
 
-        self.console.print("\n")
-        self.console.print(table)
+        return table
 
-    def _show_unmatched_exchange_table(self, trades: list[SGXTrade]) -> None:
-        """Show unmatched exchange trades table."""
-        min(len(trades), MAX_UNMATCHED_DISPLAY)
-        title = f"Unmatched Exchange Trades ({len(trades)})"
-        if len(trades) > MAX_UNMATCHED_DISPLAY:
-            title += f" - Showing first {MAX_UNMATCHED_DISPLAY}"
-        table = Table(title=title, box=box.ROUNDED)
-        table.add_column("ID", style="cyan")
-        table.add_column("Deal ID", justify="right")
-        table.add_column("Product", style="green")
-        table.add_column("Contract", style="yellow")
-        table.add_column("Quantity", justify="right", style="blue")
-        table.add_column("Price", justify="right", style="magenta")
-        table.add_column("B/S", justify="center")
-        table.add_column("Trader ID", style="dim")
-
-        for trade in trades[:MAX_UNMATCHED_DISPLAY]:  # Limit display for performance
+    def _build_unmatched_exchange_table(self, trades: list[SGXTrade]) -> Table:
+        """Build unmatched exchange trades table."""
+        n = len(trades)
+        limit = MAX_UNMATCHED_DISPLAY
+        title = f"Unmatched Exchange Trades ({n})"
+        if n > limit:
+            title += f" - Showing first {limit}"
+        table = _build_table(title, _UNMATCHED_EXCHANGE_COLUMNS)
+
+        # Limit display for performance without copying the full list
+        for trade in islice(trades, limit):
             table.add_row(
                 trade.display_id,
                 str(trade.deal_id or ""),
@@ -385,8 +504,7 @@ class SGXDisplay:
                 trade.trader_id or "",
             )
 
-        self.console.print("\n")
-        self.console.print(table)
+        return table
 
     def show_error(self, message: str) -> None:
         """Display error message.
@@ -394,7 +512,7 @@ class SGXDisplay:
         Args:
             message: Error message to display
         """
-        self.console.print(f"[bold red]Error:[/bold red] {message}")
+        self._print_message("Error:", _BOLD_RED, message)
 
     def show_success(self, message: str) -> None:
         """Display success message.
@@ -402,7 +520,7 @@ class SGXDisplay:
         Args:
             message: Success message to display
         """
-        self.console.print(f"[bold green]Success:[/bold green] {message}")
+        self._print_message("Success:", _BOLD_GREEN, message)
 
     def show_warning(self, message: str) -> None:
         """Display warning message.
@@ -410,7 +528,19 @@ class SGXDisplay:
         Args:
             message: Warning message to display
         """
-        self.console.print(f"[bold yellow]Warning:[/bold yellow] {message}")
+        self._print_message("Warning:", _BOLD_YELLOW, message)
+
+    def _print_message(self, label: str, label_style: Style, message: str) -> None:
+        """Print a styled label followed by the message without markup parsing.
+
+        The message is kept literal and only run through the console
+        highlighter, matching how console.print renders plain strings.
+        """
+        text = Text()
+        text.append(label, style=label_style)
+        text.append(" ")
+        text.append_text(self.console.highlighter(Text(message)))
+        self.console.print(text)
 
     def show_rules_information(self, rules_info: list[dict[str, Any]]) -> None:
         """Display detailed information about matching rules.
@@ -425,19 +555,14 @@ class SGXDisplay:
         self.console.print(Panel.fit(header, border_style="blue"))
 
         # Rules table
-        table = Table(title="Rule Overview", box=box.ROUNDED)
-        table.add_column("Rule", justify="center", style="cyan")
-        table.add_column("Name", style="bold")
-        table.add_column("Type", style="green")
-        table.add_column("Confidence", justify="right", style="yellow")
-        table.add_column("Description", style="dim")
+        table = _build_table("Rule Overview", _RULES_COLUMNS)
 
         for rule in rules_info:
             table.add_row(
                 str(rule.get("rule_number", "N/A")),
                 rule.get("rule_name", "Unknown"),
                 rule.get("match_type", "unknown"),
-                f"{rule.get('confidence', 0):.1f}%",
+                RATE_FMT % rule.get("confidence", 0),
                 rule.get("description", "No description available"),
             )
 
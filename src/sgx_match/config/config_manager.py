@@ -1,11 +1,33 @@
 """Configuration manager for SGX trade matching system."""
 
 import json
+import re
 from pathlib import Path
 from decimal import Decimal
-from typing import Optional, Any
+from types import MappingProxyType
+from typing import Callable, Final, Mapping, Optional, Any
 from ...unified_recon.types.json_types import NormalizerConfig
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_serializer, field_validator
+
+# Use orjson when installed (the 'fast-json' extra); it parses bytes directly
+# and is much faster
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Read-only defaults shared by every SGXMatchingConfig instance
+_DEFAULT_RULE_CONFIDENCE_LEVELS = MappingProxyType(
+    {
+        1: Decimal("100"),  # Exact match
+        2: Decimal("100"),  # Spread match (changed from 95% to 100%)
+        3: Decimal("100"),  # Product spread match (changed from 95% to 100%)
+    }
+)
+# Rule 1 (exact), then Rule 2 (spread), then Rule 3 (product spread)
+_DEFAULT_PROCESSING_ORDER = (1, 2, 3)
 
 
 class SGXMatchingConfig(BaseModel):
@@ -21,28 +43,40 @@ class SGXMatchingConfig(BaseModel):
     )
 
     # Confidence levels for SGX matching rules - ALL 100% for exact matching
-    rule_confidence_levels: dict[int, Decimal] = Field(
-        default={
-            1: Decimal("100"),  # Exact match
-            2: Decimal("100"),  # Spread match (changed from 95% to 100%)
-            3: Decimal("100"),  # Product spread match (changed from 95% to 100%)
-        },
+    # Kept read-only because the default instance is shared by every manager
+    rule_confidence_levels: Mapping[int, Decimal] = Field(
+        default_factory=lambda: _DEFAULT_RULE_CONFIDENCE_LEVELS,
         description="Confidence levels for each rule (0-100%)",
     )
 
     # Processing order for rules
-    processing_order: list[int] = Field(
-        default=[
-            1,
-            2,
-            3,
-        ],  # Rule 1 (exact), then Rule 2 (spread), then Rule 3 (product spread)
+    processing_order: tuple[int, ...] = Field(
+        default=_DEFAULT_PROCESSING_ORDER,
         description="Order in which rules should be processed",
     )
 
+    @field_validator("rule_confidence_levels")
+    @classmethod
+    def freeze_rule_confidence_levels(
+        cls, v: Mapping[int, Decimal]
+    ) -> Mapping[int, Decimal]:
+        """Wrap confidence levels in a read-only mapping."""
+        return MappingProxyType(dict(v))
+
+    @field_serializer("rule_confidence_levels")
+    def serialize_rule_confidence_levels(
+        self, v: Mapping[int, Decimal]
+    ) -> dict[int, Decimal]:
+        """Serialize the read-only mapping as a plain dict."""
+        return dict(v)
+
     # Match ID prefix
 
 
+# Defaults never change and the model is frozen, so one instance is shared
+_DEFAULT_MATCHING_CONFIG: Final = SGXMatchingConfig()
+
+
 class SGXConfigManager:
     """Manages configuration for SGX trade matching system.
 
@@ -65,22 +99,74 @@ class SGXConfigManager:
 
         # Load configurations
         self._load_normalizer_config()
-        self.matching_config = SGXMatchingConfig()
+        self.matching_config = _DEFAULT_MATCHING_CONFIG
+        self._confidence_floats = {
+            rule: float(level)
+            for rule, level in self.matching_config.rule_confidence_levels.items()
+        }
 
     def _load_normalizer_config(self) -> None:
         """Load normalizer configuration from JSON file."""
         try:
-            with open(self.normalizer_config_path, "r", encoding="utf-8") as f:
-                # Load as Any first, then validate structure
-                raw_config: Any = json.load(f)
-                self.normalizer_config = raw_config
+            # Record mtime before reading so a concurrent write triggers a reload
+            self._config_mtime_ns = self.normalizer_config_path.stat().st_mtime_ns
+            # Load as Any first, then validate structure
+            raw_config: Any = _json_loads(self.normalizer_config_path.read_bytes())
+            self.normalizer_config = raw_config
         except FileNotFoundError as e:
             raise FileNotFoundError(
                 f"Normalizer config not found at {self.normalizer_config_path}"
             ) from e
         except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             raise ValueError(f"Invalid JSON in normalizer config: {e}") from e
 
+        self._cache_config_views()
+
+    def _cache_config_views(self) -> None:
+        """Resolve the config sections used by the getters once per load.
+
+        Missing sections are cached as None so the getters can still raise
+        KeyError on access, exactly as when reading the raw config.
+        """
+        config: dict[str, Any] = dict(self.normalizer_config)
+        universal = config.get("universal_matching_fields")
+        buy_sell_config = config.get("buy_sell_mappings")
+
+        self._product_mappings: Optional[dict[str, str]] = config.get(
+            "product_mappings"
+        )
+        self._month_patterns: Optional[dict[str, str]] = config.get("month_patterns")
+        self._compiled_month_patterns: Optional[list[tuple[re.Pattern[str], str]]] = (
+            [
+                (re.compile(pattern), replacement)
+                for pattern, replacement in self._month_patterns.items()
+            ]
+            if self._month_patterns is not None
+            else None
+        )
+        self._universal_fields: Optional[list[str]] = (
+            universal.get("required_fields") if universal is not None else None
+        )
+        self._universal_field_mappings: Optional[dict[str, str]] = (
+            universal.get("field_mappings") if universal is not None else None
+        )
+        # Handle both simple dict and BuySellMappings structure
+        if isinstance(buy_sell_config, dict) and "mappings" in buy_sell_config:
+            buy_sell_config = buy_sell_config["mappings"]
+        self._buy_sell_mappings: Optional[dict[str, str]] = buy_sell_config
+
+    @staticmethod
+    def _missing_key_error(key: str) -> KeyError:
+        """Build the KeyError raised when a config section is missing."""
+        return KeyError(f"Missing required key in normalizer_config.json: '{key}'")
+
+    def _missing_universal_key_error(self, field: str) -> KeyError:
+        """Build the KeyError for a missing universal_matching_fields entry."""
+        if "universal_matching_fields" not in self.normalizer_config:
+            return self._missing_key_error("universal_matching_fields")
+        return self._missing_key_error(field)
+
     def get_rule_confidence(self, rule_number: int) -> Decimal:
         """Get confidence level for a specific rule.
 
@@ -99,13 +185,33 @@ class SGXConfigManager:
         # mypy now knows confidence is not None, so it's Decimal
         return confidence
 
-    def get_processing_order(self) -> list[int]:
+    def get_rule_confidence_float(self, rule_number: int) -> float:
+        """Get confidence level for a specific rule as a float.
+
+        Precomputed from the Decimal levels for callers that report or compare
+        confidence numerically and do not need Decimal precision.
+
+        Args:
+            rule_number: Rule number (1, 2, etc.)
+
+        Returns:
+            Confidence level as float (0-100)
+
+        Raises:
+            ValueError: If rule number is not configured
+        """
+        confidence = self._confidence_floats.get(rule_number)
+        if confidence is None:
+            raise ValueError(f"No confidence level configured for rule {rule_number}")
+        return confidence
+
+    def get_processing_order(self) -> tuple[int, ...]:
         """Get the order in which rules should be processed.
 
         Returns:
-            List of rule numbers in processing order
+            Immutable tuple of rule numbers in processing order
         """
-        return list(self.matching_config.processing_order)
+        return self.matching_config.processing_order
 
     def get_universal_matching_fields(self) -> list[str]:
         """Get list of universal matching field names from config.
@@ -116,13 +222,9 @@ class SGXConfigManager:
         Raises:
             KeyError: If required configuration keys are missing
         """
-        try:
-            universal = self.normalizer_config["universal_matching_fields"]
-            return universal["required_fields"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing required key in normalizer_config.json: {e}"
-            ) from e
+        if self._universal_fields is None:
+            raise self._missing_universal_key_error("required_fields")
+        return self._universal_fields
 
     def get_universal_field_mappings(self) -> dict[str, str]:
         """Get mapping from config field names to Trade model attributes.
@@ -133,13 +235,9 @@ class SGXConfigManager:
         Raises:
             KeyError: If required configuration keys are missing
         """
-        try:
-            universal = self.normalizer_config["universal_matching_fields"]
-            return universal["field_mappings"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing required key in normalizer_config.json: {e}"
-            ) from e
+        if self._universal_field_mappings is None:
+            raise self._missing_universal_key_error("field_mappings")
+        return self._universal_field_mappings
 
     def get_product_mappings(self) -> dict[str, str]:
         """Get product name mappings from config.
@@ -150,12 +248,9 @@ class SGXConfigManager:
         Raises:
             KeyError: If required configuration keys are missing
         """
-        try:
-            return self.normalizer_config["product_mappings"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing required key in normalizer_config.json: {e}"
-            ) from e
+        if self._product_mappings is None:
+            raise self._missing_key_error("product_mappings")
+        return self._product_mappings
 
     def get_month_patterns(self) -> dict[str, str]:
         """Get month pattern mappings from config.
@@ -166,39 +261,53 @@ class SGXConfigManager:
         Raises:
             KeyError: If required configuration keys are missing
         """
-        try:
-            return self.normalizer_config["month_patterns"]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing required key in normalizer_config.json: {e}"
-            ) from e
+        if self._month_patterns is None:
+            raise self._missing_key_error("month_patterns")
+        return self._month_patterns
+
+    def get_compiled_month_patterns(self) -> list[tuple[re.Pattern[str], str]]:
+        """Get month patterns from config, precompiled at load time.
+
+        Returns:
+            List of (compiled pattern, replacement) pairs in config order
+
+        Raises:
+            KeyError: If required configuration keys are missing
+        """
+        if self._compiled_month_patterns is None:
+            raise self._missing_key_error("month_patterns")
+        return self._compiled_month_patterns
 
     def get_buy_sell_mappings(self) -> dict[str, str]:
         """Get buy/sell value mappings from config.
 
         Returns:
             Dict mapping raw buy/sell values to normalized values
-            
+
         Raises:
             KeyError: If required configuration keys are missing
         """
-        try:
-            buy_sell_config = self.normalizer_config["buy_sell_mappings"]
-            # Handle both simple dict and BuySellMappings structure
-            if isinstance(buy_sell_config, dict):
-                if "mappings" in buy_sell_config:
-                    return buy_sell_config["mappings"]  # type: ignore[return-value]
-            return buy_sell_config  # type: ignore[return-value]
-        except KeyError as e:
-            raise KeyError(
-                f"Missing required key in normalizer_config.json: {e}"
-            ) from e
+        if self._buy_sell_mappings is None:
+            raise self._missing_key_error("buy_sell_mappings")
+        return self._buy_sell_mappings
 
     def reload_config(self) -> None:
         """Reload configuration from files.
 
-        Useful for development and testing when config files change.
+        Useful for development and testing when config files change. The
+        reparse is skipped when the file's modification time is unchanged.
         """
+        try:
+            mtime_ns = self.normalizer_config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None  # Let _load_normalizer_config raise the usual error
+        if mtime_ns is not None and mtime_ns == self._config_mtime_ns:
+            return
+
         self._load_normalizer_config()
-        # MatchingConfig is immutable, so we create a new instance
-        self.matching_config = SGXMatchingConfig()
+        # MatchingConfig is immutable and built from defaults, so reuse it
+        self.matching_config = _DEFAULT_MATCHING_CONFIG
+        self._confidence_floats = {
+            rule: float(level)
+            for rule, level in self.matching_config.rule_confidence_levels.items()
+        }
@@ -1,6 +1,6 @@
 """Unmatched SGX trade pool manager for ensuring non-duplication."""
 
-from typing import Any, Set, TYPE_CHECKING
+from typing import AbstractSet, Any, Set, TYPE_CHECKING
 import logging
 
 from ..models import SGXTrade, SGXTradeSource
@@ -83,6 +83,23 @@ class SGXUnmatchedPool:
         else:
             raise ValueError(f"Unknown trade source: {source}")
 
+    @property
+    def unmatched_trader_ids(self) -> AbstractSet[str]:
+        """Live read-only view of unmatched trader trade IDs.
+
+        Lets matchers test membership in hot loops without a method call per
+        trade; the view reflects matches recorded after it was taken.
+        """
+        return self._trader_pool.keys()
+
+    @property
+    def unmatched_exchange_ids(self) -> AbstractSet[str]:
+        """Live read-only view of unmatched exchange trade IDs.
+
+        See unmatched_trader_ids.
+        """
+        return self._exchange_pool.keys()
+
     def record_match(self, match_result: "SGXMatchResult") -> bool:
         """Atomically record a match and remove all involved trades from pools.
 
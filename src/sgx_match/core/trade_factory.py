@@ -2,15 +2,112 @@
 
 import pandas as pd
 from pathlib import Path
-from typing import Optional, Union, Mapping, Hashable
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    Union,
+)
 from decimal import Decimal
+import importlib.util
+import json
 import logging
+import os
 
 from ..models import SGXTrade, SGXTradeSource
 from ..normalizers import SGXTradeNormalizer
 
 logger = logging.getLogger(__name__)
 
+# pyarrow is only needed for the optional CSV reader and Parquet cache
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Parquet schema metadata key holding the size and mtime of the source CSV
+_PARQUET_SOURCE_KEY = b"sgx_match.source_csv"
+
+# Columns kept as text on load so IDs keep leading zeros and full precision.
+# pandas' engine="pyarrow" infers types before applying dtype, so the pyarrow
+# reader passes these to pyarrow.csv as column types instead.
+_CSV_STRING_COLUMNS: Mapping[Hashable, str] = {
+    "dealid": "str",
+    "tradeid": "str",
+    "tradedate": "str",
+    "tradetime": "str",
+    "cleareddate": "str",
+    "clearedat": "str",
+    "contractmonth": "str",
+}
+
+
+# Columns read by the row creators; everything else is left out of the row
+# dicts. The underscore columns are derived column-wise in from_dataframe.
+_DERIVED_ROW_COLUMNS = (
+    "_internal_trade_id",
+    "_product_name",
+    "_contract_month",
+    "_buy_sell",
+)
+_COMMON_ROW_COLUMNS = (
+    *_DERIVED_ROW_COLUMNS,
+    "quantityunit",
+    "quantitylot",
+    "price",
+    "unit",
+    "brokergroupid",
+    "exchangegroupid",
+    "exchclearingacctid",
+    "strike",
+    "put_call",
+    "traderid",
+    "tradedate",
+    "tradetime",
+    "spread",
+    "specialcomms",
+)
+# Free-text columns the creators read as stripped strings; they are cleaned
+# column-wise in from_dataframe instead of through _safe_str per row
+_TEXT_ROW_COLUMNS = frozenset(
+    {
+        "unit",
+        "put_call",
+        "traderid",
+        "tradedate",
+        "tradetime",
+        "spread",
+        "specialcomms",
+        "productid",
+        "clearingstatus",
+        "tradingsession",
+        "cleareddate",
+    }
+)
+# Integer ID columns, converted once per distinct value through _safe_int
+_INTEGER_ROW_COLUMNS = frozenset(
+    {
+        "brokergroupid",
+        "exchangegroupid",
+        "exchclearingacctid",
+        "productgroupid",
+        "dealid",
+    }
+)
+_TRADER_ROW_COLUMNS = (*_COMMON_ROW_COLUMNS, "productid", "productgroupid")
+_EXCHANGE_ROW_COLUMNS = (
+    *_COMMON_ROW_COLUMNS,
+    "dealid",
+    "clearingstatus",
+    "tradingsession",
+    "cleareddate",
+)
+
+
+def _normalize_column_name(column: str) -> str:
+    """Normalize a raw column header to the factory's lowercase field name."""
+    return column.strip().lower().replace("/", "_")
+
 
 class SGXTradeFactory:
     """Factory for creating SGX Trade objects from various input formats.
@@ -19,13 +116,16 @@ class SGXTradeFactory:
     input sources (CSV, DataFrame, JSON, API) to support flexible data ingestion.
     """
 
-    def __init__(self, normalizer: SGXTradeNormalizer):
+    def __init__(self, normalizer: SGXTradeNormalizer, validate_trades: bool = False):
         """Initialize the trade factory.
 
         Args:
             normalizer: The SGXTradeNormalizer instance for data standardization
+            validate_trades: Run full Pydantic validation for every trade instead
+                of constructing from the already-normalized values
         """
         self.normalizer = normalizer
+        self.validate_trades = validate_trades
 
     def from_dataframe(
         self, df: pd.DataFrame, source: SGXTradeSource
@@ -48,9 +148,11 @@ class SGXTradeFactory:
 
         logger.info(f"Creating {len(df)} {source.value} trades from DataFrame")
 
-        # Ensure DataFrame has proper column names (lowercase)
-        df = df.copy()
-        df.columns = df.columns.str.strip().str.lower().str.replace("/", "_")
+        # Ensure DataFrame has proper column names (lowercase); rename returns a
+        # new frame, so the caller's DataFrame is left untouched
+        df = df.rename(
+            columns={column: _normalize_column_name(column) for column in df.columns}
+        )
 
         # Validate and prepare DataFrame
         self._validate_required_fields(df, source)
@@ -60,8 +162,56 @@ class SGXTradeFactory:
         # Reset index to ensure consistent 0-based indices
         df = df.reset_index(drop=True)
 
+        # Normalize the categorical fields column-wise before the row loop
+        normalizer = self.normalizer
+        df["_product_name"] = self._normalize_column(
+            df["productname"], normalizer.normalize_product_name
+        )
+        df["_contract_month"] = self._normalize_column(
+            df["contractmonth"], normalizer.normalize_contract_month
+        )
+        df["_buy_sell"] = self._normalize_column(
+            df["b_s"], normalizer.normalize_buy_sell
+        )
+        df["_internal_trade_id"] = self._build_internal_trade_ids(df)
+
+        # Pull each column out once as an object array and zip them into plain
+        # dict rows; iterrows() would build a new Series for every row
+        row_columns = (
+            _TRADER_ROW_COLUMNS
+            if source == SGXTradeSource.TRADER
+            else _EXCHANGE_ROW_COLUMNS
+        )
+        columns: list[Hashable] = [c for c in row_columns if c in df.columns]
+        arrays: list[Iterable[Any]] = []
+        # Rows whose values failed column-wise conversion are skipped below
+        row_errors: dict[int, Exception] = {}
+        for column in columns:
+            # Text and integer ID columns are converted here, column-wise
+            if column in _TEXT_ROW_COLUMNS:
+                arrays.append(
+                    self._share_strings(
+                        self._clean_text_column(df[column]).to_numpy(dtype=object)
+                    )
+                )
+            elif column in _INTEGER_ROW_COLUMNS:
+                arrays.append(
+                    self._convert_distinct(df[column], self._safe_int, row_errors)
+                )
+            else:
+                # Missing cells become None in one vectorized pass, so the
+                # per-field helpers only need an identity check
+                raw = df[column].astype(object)
+                arrays.append(raw.where(raw.notna(), None).to_numpy())
+
         # Enumerate over rows for guaranteed integer index
-        for i, (_, row) in enumerate(df.iterrows()):
+        for i, values in enumerate(zip(*arrays, strict=True)):
+            if row_errors and i in row_errors:
+                logger.error(
+                    f"Error creating {source.value} trade from row {i}: {row_errors[i]}"
+                )
+                continue
+            row = dict(zip(columns, values, strict=True))
             try:
                 if source == SGXTradeSource.TRADER:
                     trade = self._create_trader_trade(row, i)
@@ -77,12 +227,142 @@ class SGXTradeFactory:
         logger.info(f"Successfully created {len(trades)} {source.value} trades")
         return trades
 
-    def from_csv(self, csv_path: Path, source: SGXTradeSource) -> list[SGXTrade]:
+    def _build_internal_trade_ids(self, df: pd.DataFrame) -> list[str]:
+        """Build internal trade IDs for every row in one pass.
+
+        Uses internaltradeid from the JSON mapping, falling back to the
+        row index where it is missing.
+
+        Args:
+            df: DataFrame with a 0-based index
+
+        Returns:
+            Internal trade IDs in row order
+        """
+        row_ids = list(map(str, range(len(df))))
+        if "internaltradeid" not in df.columns:
+            return row_ids
+
+        safe_str = self._safe_str
+        return [
+            safe_str(value) or row_id
+            for value, row_id in zip(
+                df["internaltradeid"].to_numpy(dtype=object), row_ids, strict=True
+            )
+        ]
+
+    def _clean_text_column(self, column: pd.Series) -> pd.Series:
+        """Apply _safe_str to a whole column with vectorized pandas operations.
+
+        Args:
+            column: Raw column values
+
+        Returns:
+            Column of stripped strings with missing values as ""
+        """
+        return column.astype(object).where(column.notna(), "").astype(str).str.strip()
+
+    @staticmethod
+    def _share_strings(values: Iterable[str]) -> list[str]:
+        """Replace equal strings with one shared object per distinct value.
+
+        Text columns such as unit or clearing status repeat heavily; sharing
+        the objects keeps one copy per value across all trades and lets
+        matcher comparisons short-circuit on identity.
+        """
+        canonical: dict[str, str] = {}
+        setdefault = canonical.setdefault
+        return [setdefault(value, value) for value in values]
+
+    def _convert_distinct(
+        self,
+        column: pd.Series,
+        convert: Callable[[Any], Any],
+        row_errors: dict[int, Exception],
+    ) -> list[Any]:
+        """Convert a column, calling the converter once per distinct value.
+
+        A value the converter raises on becomes None and its rows are recorded
+        in ``row_errors``, so only those rows are skipped rather than the load.
+
+        Args:
+            column: Raw column values
+            convert: Per-value converter such as _safe_int
+            row_errors: Row index to conversion error, updated in place
+
+        Returns:
+            Converted values in row order
+        """
+        values = column.to_numpy(dtype=object)
+        try:
+            distinct = dict.fromkeys(values)
+        except TypeError:  # Unhashable cell values
+            distinct = None
+
+        if distinct is None:
+            converted = []
+            for i, value in enumerate(values):
+                try:
+                    converted.append(convert(value))
+                except Exception as e:
+                    converted.append(None)
+                    row_errors.setdefault(i, e)
+            return converted
+
+        lookup: dict[Any, Any] = {}
+        errors: dict[Any, Exception] = {}
+        for value in distinct:
+            try:
+                lookup[value] = convert(value)
+            except Exception as e:
+                lookup[value] = None
+                errors[value] = e
+        if errors:
+            for i, value in enumerate(values):
+                if value in errors:
+                    row_errors.setdefault(i, errors[value])
+        return [lookup[value] for value in values]
+
+    def _normalize_column(
+        self, column: pd.Series, normalize: Callable[[str], str]
+    ) -> list[str]:
+        """Normalize a column, calling the normalizer once per distinct value.
+
+        Args:
+            column: Raw column values
+            normalize: Normalizer method taking the cleaned string value
+
+        Returns:
+            Normalized values in row order; values the normalizer fails on
+            become "" so the essential-field check drops their rows
+        """
+        safe_str = self._safe_str
+        raw_values = [safe_str(value) for value in column.to_numpy(dtype=object)]
+        lookup: dict[str, str] = {}
+        for raw in dict.fromkeys(raw_values):
+            try:
+                lookup[raw] = normalize(raw)
+            except Exception as e:
+                logger.warning(f"Could not normalize value {raw!r}: {e}")
+                lookup[raw] = ""
+        return [lookup[raw] for raw in raw_values]
+
+    def from_csv(
+        self,
+        csv_path: Path,
+        source: SGXTradeSource,
+        cache_parquet: bool = False,
+        pyarrow_csv: bool = False,
+    ) -> list[SGXTrade]:
         """Create trades from a CSV file (backward compatibility).
 
         Args:
             csv_path: Path to CSV file
             source: Whether this is trader or exchange data
+            cache_parquet: Keep a Parquet copy next to the CSV and read that
+                instead while it is newer than the CSV (requires pyarrow)
+            pyarrow_csv: Parse the CSV with pyarrow's multithreaded reader
+                instead of pandas' C engine (requires pyarrow)
 
         Returns:
             List of SGXTrade objects
@@ -99,9 +379,17 @@ class SGXTradeFactory:
             )
 
         try:
-            # Force ID columns to be read as strings to prevent scientific notation
-            dtype_spec: Mapping[Hashable, str] = {"dealid": "str", "tradeid": "str"}
-            df = pd.read_csv(csv_path, encoding="utf-8-sig", dtype=dtype_spec)
+            # Read the header first so only the columns used downstream are parsed
+            header = pd.read_csv(csv_path, encoding="utf-8-sig", nrows=0).columns
+            used_columns = self._get_csv_columns(source)
+            usecols = [c for c in header if _normalize_column_name(c) in used_columns]
+
+            if cache_parquet and _HAS_PYARROW:
+                df = self._read_cached_csv(csv_path, usecols, pyarrow_csv)
+            else:
+                if cache_parquet:
+                    logger.warning("pyarrow is not installed; Parquet cache disabled")
+                df = self._read_csv(csv_path, usecols, pyarrow_csv)
             logger.info(f"Loaded {len(df)} rows from {source.value} CSV")
 
             return self.from_dataframe(df, source)
@@ -110,6 +398,131 @@ class SGXTradeFactory:
             logger.error(f"Error loading {source.value} CSV {csv_path}: {e}")
             raise ValueError(f"Failed to load {source.value} CSV: {e}") from e
 
+    @staticmethod
+    def _read_csv(
+        csv_path: Path, usecols: Optional[list[str]], pyarrow_csv: bool = False
+    ) -> pd.DataFrame:
+        """Read a CSV with ID and date/time columns kept as text.
+
+        Args:
+            csv_path: Path to CSV file
+            usecols: Columns to parse, or None for all of them
+            pyarrow_csv: Use pyarrow's CSV reader when it is installed
+
+        Returns:
+            DataFrame with the same dtypes whichever reader is used
+        """
+        if pyarrow_csv:
+            if _HAS_PYARROW:
+                return SGXTradeFactory._read_csv_pyarrow(csv_path, usecols)
+            logger.warning("pyarrow is not installed; using the pandas CSV reader")
+
+        # Force ID and date/time columns to be read as strings
+        return pd.read_csv(
+            csv_path,
+            encoding="utf-8-sig",
+            dtype=_CSV_STRING_COLUMNS,
+            engine="c",
+            usecols=usecols,
+        )
+
+    @staticmethod
+    def _read_csv_pyarrow(csv_path: Path, usecols: Optional[list[str]]) -> pd.DataFrame:
+        """Read a CSV with pyarrow.csv using an explicit text schema.
+
+        The text columns are typed as strings at parse time, so IDs keep
+        leading zeros. Timestamp inference is disabled and all-empty columns
+        become float64, which matches what the C engine returns.
+
+        Args:
+            csv_path: Path to CSV file
+            usecols: Columns to parse, or None for all of them
+
+        Returns:
+            DataFrame with the same dtypes as the C engine read
+        """
+        import pyarrow as pa  # type: ignore[import-not-found, import-untyped]
+        import pyarrow.csv as pacsv  # type: ignore[import-not-found, import-untyped]
+
+        table = pacsv.read_csv(
+            csv_path,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={
+                    str(column): pa.string() for column in _CSV_STRING_COLUMNS
+                },
+                strings_can_be_null=True,
+                timestamp_parsers=[],
+                include_columns=usecols,
+            ),
+        )
+        schema = pa.schema(
+            pa.field(field.name, pa.float64())
+            if pa.types.is_null(field.type)
+            else field
+            for field in table.schema
+        )
+        return table.cast(schema).to_pandas()
+
+    @staticmethod
+    def _read_cached_csv(
+        csv_path: Path, usecols: list[str], pyarrow_csv: bool = False
+    ) -> pd.DataFrame:
+        """Read a CSV through its Parquet copy, refreshing the copy if stale.
+
+        The whole CSV is cached so the copy serves either trade source; only
+        ``usecols`` are read back from it. The copy records the CSV's size and
+        mtime and is only used while both still match exactly, so a CSV
+        replaced with an older timestamp is not served from a stale copy.
+
+        Args:
+            csv_path: Path to CSV file
+            usecols: Columns to return
+            pyarrow_csv: Parse the CSV with pyarrow when refreshing the copy
+
+        Returns:
+            DataFrame with the same dtypes as a direct CSV read
+        """
+        try:
+            import pyarrow as pa  # type: ignore[import-not-found, import-untyped]
+            import pyarrow.parquet as pq  # type: ignore[import-not-found, import-untyped]
+        except ImportError as e:
+            logger.warning(f"pyarrow is not available; Parquet cache disabled: {e}")
+            return SGXTradeFactory._read_csv(csv_path, usecols, pyarrow_csv)
+
+        parquet_path = csv_path.with_suffix(".parquet")
+        csv_stat = csv_path.stat()
+        source_stamp = json.dumps(
+            {"size": csv_stat.st_size, "mtime_ns": csv_stat.st_mtime_ns}
+        ).encode()
+        try:
+            metadata = pq.read_schema(parquet_path).metadata or {}
+            if metadata.get(_PARQUET_SOURCE_KEY) == source_stamp:
+                logger.info(f"Reading cached Parquet copy {parquet_path}")
+                return pd.read_parquet(parquet_path, columns=usecols)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable Parquet cache {parquet_path}: {e}")
+
+        df = SGXTradeFactory._read_csv(csv_path, None, pyarrow_csv)
+        # Write to a temporary file and rename it into place, so a reader never
+        # sees a half-written copy
+        temp_path = parquet_path.with_name(f".{parquet_path.name}.{os.getpid()}.tmp")
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), _PARQUET_SOURCE_KEY: source_stamp}
+            )
+            pq.write_table(table, temp_path, compression="zstd")
+            os.replace(temp_path, parquet_path)
+        # pyarrow's ArrowInvalid, ArrowTypeError and ArrowNotImplementedError
+        # subclass these builtins
+        except (OSError, ValueError, TypeError, NotImplementedError) as e:
+            logger.warning(f"Could not write Parquet cache {parquet_path}: {e}")
+            temp_path.unlink(missing_ok=True)
+        return df[usecols]
+
     def from_json(
         self,
         json_data: list[dict[str, Union[str, int, float, None]]],
@@ -291,6 +704,20 @@ class SGXTradeFactory:
 
         return optional
 
+    def _get_csv_columns(self, source: SGXTradeSource) -> set[str]:
+        """Get the normalized column names read from a CSV for the source type."""
+        row_columns = (
+            _TRADER_ROW_COLUMNS
+            if source == SGXTradeSource.TRADER
+            else _EXCHANGE_ROW_COLUMNS
+        )
+        return {
+            "internaltradeid",
+            *self._get_required_fields(source),
+            *self._get_optional_fields(source),
+            *row_columns,
+        }
+
     def _validate_required_fields(
         self, df: pd.DataFrame, source: SGXTradeSource
     ) -> None:
@@ -340,64 +767,66 @@ class SGXTradeFactory:
 
         return df
 
-    def _create_trader_trade(self, row: pd.Series, index: int) -> Optional[SGXTrade]:
+    def _create_trader_trade(
+        self, row: Mapping[Hashable, Any], index: int
+    ) -> Optional[SGXTrade]:
         """Create a SGXTrade object from a trader data row.
 
         Args:
-            row: Pandas Series containing trade data
-            index: Row index for trade ID generation
+            row: Mapping of column name to value for one trade row
+            index: Row index, used for error reporting
 
         Returns:
             SGXTrade object or None if creation fails
         """
+        # Bind the per-field helpers once per row
+        safe_str = self._safe_str
+        safe_decimal = self._safe_decimal
+        get = row.get
+
         try:
             # Get raw values
-            raw_product = self._safe_str(row.get("productname"))
-            raw_month = self._safe_str(row.get("contractmonth"))
-            raw_buy_sell = self._safe_str(row.get("b_s"))
-            quantity_units = self._safe_str(row.get("quantityunit"))
-            quantity_lots = self._safe_str(row.get("quantitylot"))
-            price = self._safe_str(row.get("price"))
-
-            # Normalize critical fields
-            product_name = self.normalizer.normalize_product_name(raw_product)
-            contract_month = self.normalizer.normalize_contract_month(raw_month)
-            buy_sell = self.normalizer.normalize_buy_sell(raw_buy_sell)
-
-            if not all([product_name, quantity_units, price, contract_month, buy_sell]):
+            quantity_units = safe_str(get("quantityunit"))
+            quantity_lots = safe_str(get("quantitylot"))
+            price = safe_str(get("price"))
+
+            # Critical fields were normalized column-wise in from_dataframe
+            product_name = row["_product_name"]
+            contract_month = row["_contract_month"]
+            buy_sell = row["_buy_sell"]
+
+            if not (
+                product_name
+                and quantity_units
+                and price
+                and contract_month
+                and buy_sell
+            ):
                 return None
 
-            # Use internaltradeid from JSON mapping or fallback to index
-            internal_trade_id_raw = self._safe_str(row.get("internaltradeid"))
-            internal_trade_id = (
-                internal_trade_id_raw if internal_trade_id_raw else str(index)
-            )
-
-            return SGXTrade(
-                internal_trade_id=internal_trade_id,
+            return self._build_trade(
+                internal_trade_id=row["_internal_trade_id"],
                 source=SGXTradeSource.TRADER,
                 product_name=product_name,
                 quantityunit=Decimal(self._clean_numeric_string(quantity_units)),
-                quantitylot=(
-                    self._safe_decimal(quantity_lots) if quantity_lots else None
-                ),
-                unit=self._safe_str(row.get("unit")),
+                quantitylot=(safe_decimal(quantity_lots) if quantity_lots else None),
+                unit=get("unit", ""),
                 price=Decimal(price),
                 contract_month=contract_month,
                 buy_sell=buy_sell,
-                broker_group_id=self._safe_int(row.get("brokergroupid")),
-                exchange_group_id=self._safe_int(row.get("exchangegroupid")),
-                exch_clearing_acct_id=self._safe_int(row.get("exchclearingacctid")),
-                strike=self._safe_decimal(row.get("strike")),
-                put_call=self._safe_str(row.get("put_call")),
-                trader_id=self._safe_str(row.get("traderid")),
-                trade_date=self._safe_str(row.get("tradedate")),
-                trade_time=self._safe_str(row.get("tradetime")),
+                broker_group_id=get("brokergroupid"),
+                exchange_group_id=get("exchangegroupid"),
+                exch_clearing_acct_id=get("exchclearingacctid"),
+                strike=safe_decimal(get("strike")),
+                put_call=get("put_call", ""),
+                trader_id=get("traderid", ""),
+                trade_date=get("tradedate", ""),
+                trade_time=get("tradetime", ""),
                 # Trader-specific optional fields
-                spread=self._safe_str(row.get("spread")),
-                product_id=self._safe_str(row.get("productid")),
-                product_group_id=self._safe_int(row.get("productgroupid")),
-                special_comms=self._safe_str(row.get("specialcomms")),
+                spread=get("spread", ""),
+                product_id=get("productid", ""),
+                product_group_id=get("productgroupid"),
+                special_comms=get("specialcomms", ""),
                 # Exchange-specific fields not needed for trader trades
                 # They will automatically be None due to Field(default=None) in the model
             )
@@ -405,69 +834,71 @@ class SGXTradeFactory:
             logger.error(f"Error creating trader trade from row {index}: {e}")
             return None
 
-    def _create_exchange_trade(self, row: pd.Series, index: int) -> Optional[SGXTrade]:
+    def _create_exchange_trade(
+        self, row: Mapping[Hashable, Any], index: int
+    ) -> Optional[SGXTrade]:
         """Create a SGXTrade object from an exchange data row.
 
         Args:
-            row: Pandas Series containing trade data
-            index: Row index for trade ID generation
+            row: Mapping of column name to value for one trade row
+            index: Row index, used for error reporting
 
         Returns:
             SGXTrade object or None if creation fails
         """
+        # Bind the per-field helpers once per row
+        safe_str = self._safe_str
+        safe_decimal = self._safe_decimal
+        get = row.get
+
         try:
             # Get raw values
-            raw_product = self._safe_str(row.get("productname"))
-            raw_month = self._safe_str(row.get("contractmonth"))
-            raw_buy_sell = self._safe_str(row.get("b_s"))
-            quantity_units = self._safe_str(row.get("quantityunit"))
-            quantity_lots = self._safe_str(row.get("quantitylot"))
-            price = self._safe_str(row.get("price"))
-
-            # Normalize critical fields
-            product_name = self.normalizer.normalize_product_name(raw_product)
-            contract_month = self.normalizer.normalize_contract_month(raw_month)
-            buy_sell = self.normalizer.normalize_buy_sell(raw_buy_sell)
-
-            if not all([product_name, quantity_units, price, contract_month, buy_sell]):
+            quantity_units = safe_str(get("quantityunit"))
+            quantity_lots = safe_str(get("quantitylot"))
+            price = safe_str(get("price"))
+
+            # Critical fields were normalized column-wise in from_dataframe
+            product_name = row["_product_name"]
+            contract_month = row["_contract_month"]
+            buy_sell = row["_buy_sell"]
+
+            if not (
+                product_name
+                and quantity_units
+                and price
+                and contract_month
+                and buy_sell
+            ):
                 return None
 
-            # Use internaltradeid from JSON mapping or fallback to index
-            internal_trade_id_raw = self._safe_str(row.get("internaltradeid"))
-            internal_trade_id = (
-                internal_trade_id_raw if internal_trade_id_raw else str(index)
-            )
-
-            return SGXTrade(
-                internal_trade_id=internal_trade_id,
+            return self._build_trade(
+                internal_trade_id=row["_internal_trade_id"],
                 source=SGXTradeSource.EXCHANGE,
                 product_name=product_name,
                 quantityunit=Decimal(self._clean_numeric_string(quantity_units)),
-                quantitylot=(
-                    self._safe_decimal(quantity_lots) if quantity_lots else None
-                ),
-                unit=self._safe_str(row.get("unit")),
+                quantitylot=(safe_decimal(quantity_lots) if quantity_lots else None),
+                unit=get("unit", ""),
                 price=Decimal(price),
                 contract_month=contract_month,
                 buy_sell=buy_sell,
-                broker_group_id=self._safe_int(row.get("brokergroupid")),
-                exchange_group_id=self._safe_int(row.get("exchangegroupid")),
-                exch_clearing_acct_id=self._safe_int(row.get("exchclearingacctid")),
-                strike=self._safe_decimal(row.get("strike")),
-                put_call=self._safe_str(row.get("put_call")),
-                deal_id=self._safe_int(row.get("dealid")),
-                trade_date=self._safe_str(row.get("tradedate")),
-                trade_time=self._safe_str(
-                    row.get("tradetime")
+                broker_group_id=get("brokergroupid"),
+                exchange_group_id=get("exchangegroupid"),
+                exch_clearing_acct_id=get("exchclearingacctid"),
+                strike=safe_decimal(get("strike")),
+                put_call=get("put_call", ""),
+                deal_id=get("dealid"),
+                trade_date=get("tradedate", ""),
+                trade_time=get(
+                    "tradetime", ""
                 ),  # Exchange now uses tradetime (standardized)
                 # Exchange-specific optional fields
-                clearing_status=self._safe_str(row.get("clearingstatus")),
-                trading_session=self._safe_str(row.get("tradingsession")),
-                cleared_date=self._safe_str(row.get("cleareddate")),
+                clearing_status=get("clearingstatus", ""),
+                trading_session=get("tradingsession", ""),
+                cleared_date=get("cleareddate", ""),
                 # Common optional fields
-                trader_id=self._safe_str(row.get("traderid")),
-                spread=self._safe_str(row.get("spread")),
-                special_comms=self._safe_str(row.get("specialcomms")),
+                trader_id=get("traderid", ""),
+                spread=get("spread", ""),
+                special_comms=get("specialcomms", ""),
                 # Trader-specific fields not needed for exchange trades
                 # They will automatically be None due to Field(default=None) in the model
             )
@@ -475,15 +906,46 @@ class SGXTradeFactory:
             logger.error(f"Error creating exchange trade from row {index}: {e}")
             return None
 
+    def _build_trade(self, **fields: Any) -> SGXTrade:
+        """Build an SGXTrade from normalized field values.
+
+        The row creators already produce the model's types, so validation is
+        skipped with model_construct. The field constraints it would have
+        enforced are checked explicitly so invalid rows are still rejected.
+
+        Raises:
+            ValueError: If a value violates an SGXTrade field constraint
+        """
+        if self.validate_trades:
+            return SGXTrade(**fields)
+
+        quantityunit: Decimal = fields["quantityunit"]
+        if not quantityunit.is_finite() or quantityunit <= 0:
+            raise ValueError(f"quantityunit must be greater than 0: {quantityunit}")
+        quantitylot: Optional[Decimal] = fields.get("quantitylot")
+        if quantitylot is not None and (not quantitylot.is_finite() or quantitylot < 0):
+            raise ValueError(f"quantitylot must be 0 or greater: {quantitylot}")
+        if not fields["price"].is_finite():
+            raise ValueError(f"price must be finite: {fields['price']}")
+        strike: Optional[Decimal] = fields.get("strike")
+        if strike is not None and not strike.is_finite():
+            raise ValueError(f"strike must be finite: {strike}")
+        if fields["buy_sell"] not in ("B", "S"):
+            raise ValueError(f"buy_sell must be 'B' or 'S': {fields['buy_sell']!r}")
+
+        return SGXTrade.model_construct(**fields)
+
     def _safe_str(self, value: Union[str, int, float, None]) -> str:
         """Safely convert value to string, handling NaN and None."""
-        if pd.isna(value) or value is None:
+        # NaN is the only value unequal to itself; pd.NA is checked by identity
+        # because comparing it returns NA rather than a bool
+        if value is None or value is pd.NA or value != value:
             return ""
         return str(value).strip()
 
     def _safe_int(self, value: Union[str, int, float, None]) -> Optional[int]:
         """Safely convert value to int, returning None for invalid values."""
-        if pd.isna(value) or value is None or value == "":
+        if value is None or value is pd.NA or value != value or value == "":
             return None
         try:
             return int(float(str(value)))
@@ -492,7 +954,7 @@ class SGXTradeFactory:
 
     def _safe_decimal(self, value: Union[str, int, float, None]) -> Optional[Decimal]:
         """Safely convert value to Decimal, returning None for invalid values."""
-        if pd.isna(value) or value is None or value == "":
+        if value is None or value is pd.NA or value != value or value == "":
             return None
         try:
             return Decimal(str(value))
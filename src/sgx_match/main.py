@@ -1,21 +1,29 @@
 """Main entry point for SGX trade matching system."""
 
+from __future__ import annotations
+
 import logging
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, TYPE_CHECKING
 import argparse
+import importlib.util
 import sys
-import pandas as pd
 
 from .config import SGXConfigManager
 from .core import SGXUnmatchedPool
-from .core.trade_factory import SGXTradeFactory
-from .matchers.exact_matcher import ExactMatcher
-from .matchers.spread_matcher import SpreadMatcher
-from .matchers.product_spread_matcher import ProductSpreadMatcher
 from .models import SGXMatchResult, SGXTradeSource
-from .cli import SGXDisplay
-from .normalizers import SGXTradeNormalizer
+
+# pandas, rich and the matchers are imported where they are first needed, so
+# the CLI can parse arguments and answer --help without loading them
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .core.trade_factory import SGXTradeFactory
+    from .matchers.exact_matcher import ExactMatcher
+    from .matchers.spread_matcher import SpreadMatcher
+    from .matchers.product_spread_matcher import ProductSpreadMatcher
+    from .cli import SGXDisplay
+    from .normalizers import SGXTradeNormalizer
 
 # Default file paths
 DEFAULT_DATA_DIR = Path(__file__).parent / "data"
@@ -38,15 +46,27 @@ class SGXMatchingEngine:
     product_spread_matcher: ProductSpreadMatcher
     matchers: dict[int, Any]
 
-    def __init__(self, config_manager: Optional[SGXConfigManager] = None):
+    def __init__(
+        self,
+        config_manager: Optional[SGXConfigManager] = None,
+        validate_trades: bool = False,
+    ):
         """Initialize SGX matching engine.
 
         Args:
             config_manager: Optional config manager. Creates default if None.
+            validate_trades: Run full Pydantic validation on every loaded trade
         """
+        from .core.trade_factory import SGXTradeFactory
+        from .matchers.exact_matcher import ExactMatcher
+        from .matchers.spread_matcher import SpreadMatcher
+        from .matchers.product_spread_matcher import ProductSpreadMatcher
+        from .cli import SGXDisplay
+        from .normalizers import SGXTradeNormalizer
+
         self.config_manager = config_manager or SGXConfigManager()
         self.normalizer = SGXTradeNormalizer(self.config_manager)
-        self.trade_factory = SGXTradeFactory(self.normalizer)
+        self.trade_factory = SGXTradeFactory(self.normalizer, validate_trades)
         self.display = SGXDisplay()
 
         # Initialize matchers based on config
@@ -70,6 +90,8 @@ class SGXMatchingEngine:
         trader_csv_path: Path,
         exchange_csv_path: Path,
         show_unmatched: bool = False,
+        cache_parquet: bool = False,
+        pyarrow_csv: bool = False,
     ) -> list[SGXMatchResult]:
         """Run the complete SGX matching process.
 
@@ -77,6 +99,8 @@ class SGXMatchingEngine:
             trader_csv_path: Path to trader CSV file
             exchange_csv_path: Path to exchange CSV file
             show_unmatched: Whether to display unmatched trades
+            cache_parquet: Whether to read/write Parquet copies of the CSVs
+            pyarrow_csv: Whether to parse the CSVs with pyarrow's reader
 
         Returns:
             List of all match results
@@ -84,13 +108,15 @@ class SGXMatchingEngine:
         self.display.show_header()
 
         try:
-            # Load data using trade factory
+            # Load data using trade factory, one file after the other; most of
+            # the cost is the Python row loop in from_dataframe, which holds
+            # the GIL, so loading on threads would not overlap much work
             logger.info("Loading SGX trade data...")
             trader_trades = self.trade_factory.from_csv(
-                trader_csv_path, SGXTradeSource.TRADER
+                trader_csv_path, SGXTradeSource.TRADER, cache_parquet, pyarrow_csv
             )
             exchange_trades = self.trade_factory.from_csv(
-                exchange_csv_path, SGXTradeSource.EXCHANGE
+                exchange_csv_path, SGXTradeSource.EXCHANGE, cache_parquet, pyarrow_csv
             )
 
             self.display.show_loading_summary(len(trader_trades), len(exchange_trades))
@@ -272,11 +298,38 @@ def main() -> None:
         help="Display detailed information about all matching rules and exit",
     )
 
+    parser.add_argument(
+        "--cache-parquet",
+        action="store_true",
+        help="Cache each CSV as a Parquet file beside it for faster repeated runs "
+        "(requires the 'parquet' extra, i.e. pyarrow)",
+    )
+
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Build every trade through full Pydantic validation (slower; for "
+        "checking new data sources)",
+    )
+
+    parser.add_argument(
+        "--pyarrow-csv",
+        action="store_true",
+        help="Parse the CSVs with pyarrow's multithreaded reader; falls back to "
+        "the pandas reader when pyarrow is not installed",
+    )
+
     args = parser.parse_args()
 
     # Handle --show-rules option
     if args.show_rules:
         try:
+            from .matchers.exact_matcher import ExactMatcher
+            from .matchers.spread_matcher import SpreadMatcher
+            from .matchers.product_spread_matcher import ProductSpreadMatcher
+            from .cli import SGXDisplay
+            from .normalizers import SGXTradeNormalizer
+
             config_manager = SGXConfigManager()
             normalizer = SGXTradeNormalizer(config_manager)
             display = SGXDisplay()
@@ -315,13 +368,21 @@ def main() -> None:
         )
         sys.exit(1)
 
+    if args.cache_parquet and importlib.util.find_spec("pyarrow") is None:
+        logger.error(
+            "--cache-parquet requires pyarrow. Install it with the 'parquet' extra or run without the flag."
+        )
+        sys.exit(1)
+
     # Run matching
     try:
-        engine = SGXMatchingEngine()
+        engine = SGXMatchingEngine(validate_trades=args.validate)
         matches = engine.run_matching(
             args.trader_csv,
             args.exchange_csv,
             show_unmatched=not args.no_unmatched,  # Show unmatched by default, hide if --no-unmatched
+            cache_parquet=args.cache_parquet,
+            pyarrow_csv=args.pyarrow_csv,
         )
 
         # Exit with appropriate code
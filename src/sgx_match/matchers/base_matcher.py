@@ -1,8 +1,9 @@
 """Base matcher with universal field handling for SGX trades."""
 
 from abc import ABC, abstractmethod
-from typing import Any, TYPE_CHECKING
-import uuid
+from operator import attrgetter
+from typing import Any, Callable, TYPE_CHECKING
+import os
 import logging
 from ..models import SGXTrade
 from ..config import SGXConfigManager
@@ -12,6 +13,7 @@ if TYPE_CHECKING:
 
 # Constants
 UUID_LENGTH = 8  # Length of UUID suffix for match IDs (must be 1-32)
+MATCH_ID_BATCH_SIZE = 256  # Match ID suffixes drawn per os.urandom call
 
 # Module logger
 logger = logging.getLogger(__name__)
@@ -23,6 +25,18 @@ class BaseMatcher(ABC):
     def __init__(self, config_manager: SGXConfigManager):
         """Initialize base SGX matcher with config manager."""
         self.config_manager = config_manager
+        # Resolve the universal fields to SGXTrade attribute names once; the
+        # signature and validation helpers run for every trade in the pools
+        self._universal_fields = config_manager.get_universal_matching_fields()
+        self._universal_mappings = config_manager.get_universal_field_mappings()
+        self._universal_attrs = tuple(
+            self._convert_config_field_to_trade_attribute(field_name)
+            for field_name in self._universal_fields
+        )
+        self._universal_values = self._build_universal_getter(self._universal_attrs)
+        # Buffered random hex for match ID suffixes, refilled in batches
+        self._random_hex = ""
+        self._random_pos = 0
 
     def create_universal_signature(
         self, trade: SGXTrade, rule_specific_fields: list[Any]
@@ -36,16 +50,8 @@ class BaseMatcher(ABC):
         Returns:
             Tuple containing rule-specific fields + universal field values
         """
-        # Start with rule-specific fields
-        signature_parts = list(rule_specific_fields)
-
-        # Add universal fields dynamically
-        universal_fields = self.config_manager.get_universal_matching_fields()
-        for field_name in universal_fields:
-            value = self._get_trade_field_value(trade, field_name)
-            signature_parts.append(value)
-
-        return tuple(signature_parts)
+        # Rule-specific fields followed by the universal field values
+        return tuple(rule_specific_fields) + self._universal_values(trade)
 
     def get_universal_matched_fields(
         self, rule_specific_fields: list[str]
@@ -58,15 +64,7 @@ class BaseMatcher(ABC):
         Returns:
             Complete list including universal fields
         """
-        matched_fields = list(rule_specific_fields)
-
-        # Add universal fields dynamically
-        universal_fields = self.config_manager.get_universal_matching_fields()
-        for field_name in universal_fields:
-            trade_field_name = self._convert_config_field_to_trade_attribute(field_name)
-            matched_fields.append(trade_field_name)
-
-        return matched_fields
+        return [*rule_specific_fields, *self._universal_attrs]
 
     def validate_universal_fields(self, trade1: SGXTrade, trade2: SGXTrade) -> bool:
         """Validate that universal fields match between two trades.
@@ -78,13 +76,30 @@ class BaseMatcher(ABC):
         Returns:
             True if all universal fields match, False otherwise
         """
-        universal_fields = self.config_manager.get_universal_matching_fields()
-        for field_name in universal_fields:
-            value1 = self._get_trade_field_value(trade1, field_name)
-            value2 = self._get_trade_field_value(trade2, field_name)
-            if value1 != value2:
-                return False
-        return True
+        return self._universal_values(trade1) == self._universal_values(trade2)
+
+    @staticmethod
+    def _build_universal_getter(
+        attrs: tuple[str, ...],
+    ) -> Callable[[SGXTrade], tuple[Any, ...]]:
+        """Build a function returning a trade's universal field values as a tuple.
+
+        Uses a C-level attrgetter when every attribute is an SGXTrade field,
+        falling back to getattr with a None default otherwise. attrgetter
+        returns a bare value for a single name, so that case is wrapped.
+
+        Args:
+            attrs: SGXTrade attribute names of the universal fields
+
+        Returns:
+            Function mapping a trade to its universal field values
+        """
+        if attrs and all(attr in SGXTrade.model_fields for attr in attrs):
+            if len(attrs) > 1:
+                return attrgetter(*attrs)
+            get_single = attrgetter(attrs[0])
+            return lambda trade: (get_single(trade),)
+        return lambda trade: tuple(getattr(trade, attr, None) for attr in attrs)
 
     def validate_options_compatibility(self, *trades: SGXTrade) -> bool:
         """Check if all trades have compatible option characteristics.
@@ -117,25 +132,6 @@ class BaseMatcher(ABC):
 
         return True
 
-    def _get_trade_field_value(self, trade: SGXTrade, config_field_name: str) -> Any:
-        """Get trade field value by config field name.
-
-        Args:
-            trade: SGXTrade object
-            config_field_name: Field name from config (e.g., 'brokergroupid')
-
-        Returns:
-            Field value from trade object
-        """
-        # Get field mappings from config to convert config field name to SGXTrade attribute
-        field_mappings = self.config_manager.get_universal_field_mappings()
-
-        # Get the actual SGXTrade model attribute name
-        trade_attribute = field_mappings.get(config_field_name, config_field_name)
-
-        # Use getattr to dynamically access the field
-        return getattr(trade, trade_attribute, None)
-
     def _convert_config_field_to_trade_attribute(self, config_field_name: str) -> str:
         """Convert config field name to SGXTrade model attribute name.
 
@@ -145,8 +141,7 @@ class BaseMatcher(ABC):
         Returns:
             Trade model attribute name (e.g., 'broker_group_id')
         """
-        field_mappings = self.config_manager.get_universal_field_mappings()
-        return field_mappings.get(config_field_name, config_field_name)
+        return self._universal_mappings.get(config_field_name, config_field_name)
 
     def generate_match_id(self, rule_number: int) -> str:
         """Generate a unique match ID with standardized format.
@@ -170,12 +165,19 @@ class BaseMatcher(ABC):
         if not (1 <= UUID_LENGTH <= 32):
             raise ValueError(f"UUID_LENGTH must be between 1 and 32, got {UUID_LENGTH}")
 
-        # Generate UUID suffix with validated length
-        try:
-            uuid_suffix = uuid.uuid4().hex[:UUID_LENGTH]
-        except (OSError, SystemError, ValueError) as e:
-            logger.error(f"Failed to generate UUID: {e}")
-            raise ValueError(f"UUID generation failed: {e}") from e
+        # Generate UUID suffix with validated length. uuid4 spends one
+        # os.urandom call per ID; draw random hex for a batch of IDs instead
+        pos = self._random_pos
+        if pos + UUID_LENGTH > len(self._random_hex):
+            try:
+                n_bytes = (UUID_LENGTH * MATCH_ID_BATCH_SIZE + 1) // 2
+                self._random_hex = os.urandom(n_bytes).hex()
+            except (OSError, SystemError, ValueError) as e:
+                logger.error(f"Failed to generate UUID: {e}")
+                raise ValueError(f"UUID generation failed: {e}") from e
+            pos = 0
+        uuid_suffix = self._random_hex[pos : pos + UUID_LENGTH]
+        self._random_pos = pos + UUID_LENGTH
 
         # Build match ID with standardized format: MODULE_RULE_UUID
         match_id = f"SGX_{rule_number}_{uuid_suffix}"
@@ -83,12 +83,8 @@ class ExactMatcher(BaseMatcher):
             for i in range(len(exchange_trades_list) - 1, -1, -1):
                 exchange_trade = exchange_trades_list[i]
 
-                # Verify exchange trade is still unmatched
-                if not pool_manager.is_unmatched(
-                    exchange_trade.internal_trade_id, SGXTradeSource.EXCHANGE
-                ):
-                    continue
-
+                # No is_unmatched pre-check: matched trades are removed from
+                # this index below, and record_match verifies availability
                 match_result = self._create_match_result(trader_trade, exchange_trade)
 
                 # Atomically record the match
@@ -214,7 +210,9 @@ class ExactMatcher(BaseMatcher):
             "rule_number": self.rule_number,
             "rule_name": "Exact Match",
             "match_type": SGXMatchType.EXACT.value,
-            "confidence": float(self.confidence),
+            "confidence": self.config_manager.get_rule_confidence_float(
+                self.rule_number
+            ),
             "description": "Exact matching on all key fields for SGX trades",
             "requirements": [
                 "Product name must match exactly (e.g., 'FE')",
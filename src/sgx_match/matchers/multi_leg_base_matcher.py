@@ -53,19 +53,14 @@ class MultiLegBaseMatcher(BaseMatcher, ABC):
             bool: True if trades form valid spread pair
 
         Validation criteria:
-            - Same product name
-            - Same quantity (quantityunit)
             - Opposite buy/sell directions
             - Different contract months
+            - Same product name
+            - Same quantity (quantityunit)
             - Universal fields match (broker, clearing account, etc.)
         """
-        # Must have same product
-        if trade1.product_name != trade2.product_name:
-            return False
-
-        # Must have same quantity
-        if trade1.quantityunit != trade2.quantityunit:
-            return False
+        # Cheapest and most selective checks first: candidate pairs share a
+        # dealid or trade time, so direction and month reject most of them
 
         # Must have opposite buy/sell directions
         if trade1.buy_sell == trade2.buy_sell:
@@ -75,6 +70,14 @@ class MultiLegBaseMatcher(BaseMatcher, ABC):
         if trade1.contract_month == trade2.contract_month:
             return False
 
+        # Must have same product
+        if trade1.product_name != trade2.product_name:
+            return False
+
+        # Must have same quantity
+        if trade1.quantityunit != trade2.quantityunit:
+            return False
+
         # Universal fields must match
         if not self.validate_universal_fields(trade1, trade2):
             return False
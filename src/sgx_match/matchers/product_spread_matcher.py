@@ -1,17 +1,21 @@
 """Product spread matching implementation for Rule 3."""
 
-from typing import Optional, Union
+from bisect import bisect_right
+from typing import Iterator, Optional, Union
 import logging
 from collections import defaultdict
 from decimal import Decimal
 
 from ...unified_recon.models.recon_status import ReconStatus
-from ..models import SGXTrade, SGXMatchResult, SGXMatchType, SGXTradeSource
+from ..models import SGXTrade, SGXMatchResult, SGXMatchType
 from ..core import SGXUnmatchedPool
 from ..config import SGXConfigManager
 from ..normalizers import SGXTradeNormalizer
 from .multi_leg_base_matcher import MultiLegBaseMatcher
 
+# (product names, contract month, quantity) shared by both legs of a pair
+ProductSpreadKey = tuple[frozenset[str], str, Decimal]
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +30,9 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
         self.normalizer = normalizer
         self.rule_number = 3
         self.confidence = config_manager.get_rule_confidence(self.rule_number)
+        # Per-instance cache of spread value -> PS indicator; spread takes only
+        # a handful of distinct values, so each is upper-cased once
+        self._ps_indicator_cache: dict[Optional[str], bool] = {}
         logger.info(
             f"Initialized ProductSpreadMatcher with {self.confidence}% confidence"
         )
@@ -38,41 +45,28 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
         trader_trades = pool_manager.get_unmatched_trader_trades()
         exchange_trades = pool_manager.get_unmatched_exchange_trades()
 
-        # Tier 1 & 2: Find trader product spread pairs (with and without PS)
-        trader_product_spread_pairs = self._find_trader_product_spread_pairs(
-            trader_trades, pool_manager
-        )
-
         # Tier 1 & 2: Find exchange product spread pairs using dealid grouping
-        exchange_product_spread_pairs = self._find_exchange_product_spread_pairs(
+        exchange_pair_index = self._find_exchange_product_spread_pairs(
             exchange_trades, pool_manager
         )
 
         logger.debug(
-            f"Found {len(trader_product_spread_pairs)} trader product spread pairs"
-        )
-        logger.debug(
-            f"Found {len(exchange_product_spread_pairs)} exchange product spread pairs"
+            f"Found {sum(map(len, exchange_pair_index.values()))} exchange product spread pairs"
         )
 
-        # Process Tier 1 & 2: Trader spread pairs vs Exchange spread pairs (2-to-2)
-        for trader_pair_with_tier in trader_product_spread_pairs:
+        # Process Tier 1 & 2: Trader spread pairs vs Exchange spread pairs (2-to-2).
+        # Trader pairs (with and without PS) are generated lazily and only
+        # from trades still unmatched, so pairs are tried as soon as found
+        for trader_pair_with_tier in self._iter_trader_product_spread_pairs(
+            trader_trades, pool_manager
+        ):
             # Extract trades and confidence tier
             trader_trade1, trader_trade2, confidence_tier = trader_pair_with_tier
             trader_trades_list = [trader_trade1, trader_trade2]  # Convert to list
 
-            # Skip if any trader trade is already matched
-            if any(
-                not pool_manager.is_unmatched(
-                    trade.internal_trade_id, SGXTradeSource.TRADER
-                )
-                for trade in trader_trades_list
-            ):
-                continue
-
             match_result = self._match_product_spread_pair(
                 trader_trades_list,
-                exchange_product_spread_pairs,
+                exchange_pair_index,
                 pool_manager,
                 confidence_tier,
             )
@@ -97,30 +91,32 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
         logger.info(f"Found {len(matches)} total product spread matches")
         return matches
 
-    def _find_trader_product_spread_pairs(
+    def _iter_trader_product_spread_pairs(
         self, trader_trades: list[SGXTrade], pool_manager: SGXUnmatchedPool
-    ) -> list[tuple[SGXTrade, SGXTrade, int]]:
-        """Find trader product spread pairs with PS spread indicators or identical non-zero spread prices."""
-        product_spread_pairs = []
-
-        # Log all PS trades to see what we have
-        ps_trades = [
-            trade
-            for trade in trader_trades
-            if trade.spread and "PS" in str(trade.spread).upper()
-        ]
-        logger.debug(f"Total PS trades in trader_trades: {len(ps_trades)}")
-        for trade in ps_trades:
-            logger.debug(
-                f"PS trade: {trade.product_name}/{trade.buy_sell}, price={trade.price}, contract_month={trade.contract_month}, unmatched={pool_manager.is_unmatched(trade.internal_trade_id, SGXTradeSource.TRADER)}"
-            )
+    ) -> Iterator[tuple[SGXTrade, SGXTrade, int]]:
+        """Yield trader product spread pairs with PS spread indicators or identical non-zero spread prices.
+
+        Pairs are produced lazily in a fixed order, and a pair is only yielded
+        while both of its trades are still unmatched in the pool, so trades
+        matched by the caller mid-iteration are skipped.
+        """
+        unmatched_trader = pool_manager.unmatched_trader_ids
+
+        # Log all PS trades to see what we have (only scanned when DEBUG is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            ps_trades = [
+                trade for trade in trader_trades if self._has_ps_indicator(trade.spread)
+            ]
+            logger.debug(f"Total PS trades in trader_trades: {len(ps_trades)}")
+            for trade in ps_trades:
+                logger.debug(
+                    f"PS trade: {trade.product_name}/{trade.buy_sell}, price={trade.price}, contract_month={trade.contract_month}, unmatched={trade.internal_trade_id in unmatched_trader}"
+                )
 
         # Group trades by contract month, quantity, and universal fields
         trade_groups: dict[tuple[str, ...], list[SGXTrade]] = defaultdict(list)
         for trade in trader_trades:
-            if pool_manager.is_unmatched(
-                trade.internal_trade_id, SGXTradeSource.TRADER
-            ):
+            if trade.internal_trade_id in unmatched_trader:
                 # Convert Decimal to float for consistent hashing
                 key = self.create_universal_signature(
                     trade,
@@ -136,39 +132,57 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
         logger.debug(f"Trader product spread groups: {len(trade_groups)}")
 
         # Find pairs within each group
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         for trades in trade_groups.values():
-            logger.debug(f"Checking trader group with {len(trades)} trades")
-            if len(trades) >= 1:
+            if debug_enabled:
+                logger.debug(f"Checking trader group with {len(trades)} trades")
                 # Log details of all trades in this group
                 for idx, trade in enumerate(trades):
                     logger.debug(
                         f"  Trade {idx}: {trade.product_name}/{trade.buy_sell}, price={trade.price}, spread={trade.spread}, contract_month={trade.contract_month}, quantity={trade.quantityunit}"
                     )
 
-            if len(trades) >= 2:
-                for i in range(len(trades)):
-                    for j in range(i + 1, len(trades)):
+            if len(trades) < 2:
+                continue
+
+            # Same-side pairs can never qualify, so each trade is paired only
+            # with later trades on the opposite side. Walking those in index
+            # order yields pairs in the same order as a full i < j scan.
+            side_indices: dict[str, list[int]] = defaultdict(list)
+            for idx, trade in enumerate(trades):
+                side_indices[trade.buy_sell].append(idx)
+
+            for i, trade1 in enumerate(trades):
+                opposite = side_indices["S" if trade1.buy_sell == "B" else "B"]
+                for j in opposite[bisect_right(opposite, i) :]:
+                    # trade1 may have been matched from an earlier yielded pair
+                    if trade1.internal_trade_id not in unmatched_trader:
+                        break
+                    trade2 = trades[j]
+                    if (
+                        trade2.product_name == trade1.product_name
+                        or trade2.internal_trade_id not in unmatched_trader
+                    ):
+                        continue
+                    if debug_enabled:
                         logger.debug(
-                            f"Checking trader pair: {trades[i].product_name}/{trades[i].buy_sell} + {trades[j].product_name}/{trades[j].buy_sell}"
-                        )
-                        is_match, confidence_tier = self._is_trader_product_spread_pair(
-                            trades[i], trades[j]
+                            f"Checking trader pair: {trade1.product_name}/{trade1.buy_sell} + {trade2.product_name}/{trade2.buy_sell}"
                         )
-                        if is_match:
+                    is_match, confidence_tier = self._is_trader_product_spread_pair(
+                        trade1, trade2
+                    )
+                    if is_match:
+                        if debug_enabled:
                             tier_desc = (
                                 "PS required"
                                 if confidence_tier == 1
                                 else "no PS required"
                             )
                             logger.debug(
-                                f"Found trader product spread pair (Tier {confidence_tier} - {tier_desc}): {trades[i].internal_trade_id} + {trades[j].internal_trade_id}"
-                            )
-                            # Store trades with confidence tier information
-                            product_spread_pairs.append(
-                                (trades[i], trades[j], confidence_tier)
+                                f"Found trader product spread pair (Tier {confidence_tier} - {tier_desc}): {trade1.internal_trade_id} + {trade2.internal_trade_id}"
                             )
-
-        return product_spread_pairs
+                        # Yield trades with confidence tier information
+                        yield trade1, trade2, confidence_tier
 
     def _is_trader_product_spread_pair(
         self, trade1: SGXTrade, trade2: SGXTrade
@@ -191,9 +205,9 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
             return False, 0
 
         # Tier 1: PS indicator pattern (highest confidence)
-        has_ps_indicator = (trade1.spread and "PS" in str(trade1.spread).upper()) and (
-            trade2.spread and "PS" in str(trade2.spread).upper()
-        )
+        has_ps_indicator = self._has_ps_indicator(
+            trade1.spread
+        ) and self._has_ps_indicator(trade2.spread)
 
         if has_ps_indicator:
             return True, 1  # Tier 1 - 95% confidence
@@ -208,18 +222,47 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
 
         return False, 0
 
+    def _has_ps_indicator(self, spread: Optional[str]) -> bool:
+        """Check whether a spread value carries the PS indicator, with caching."""
+        cached = self._ps_indicator_cache.get(spread)
+        if cached is None:
+            cached = bool(spread) and "PS" in str(spread).upper()
+            self._ps_indicator_cache[spread] = cached
+        return cached
+
+    @staticmethod
+    def _product_spread_key(trade1: SGXTrade, trade2: SGXTrade) -> ProductSpreadKey:
+        """Build the index key for a product spread pair.
+
+        Uses the first leg's contract month and quantity; a valid match
+        requires both legs on each side to share them.
+        """
+        return (
+            frozenset((trade1.product_name, trade2.product_name)),
+            trade1.contract_month,
+            trade1.quantityunit,
+        )
+
     def _find_exchange_product_spread_pairs(
         self, exchange_trades: list[SGXTrade], pool_manager: SGXUnmatchedPool
-    ) -> list[list[SGXTrade]]:
-        """Find exchange product spread pairs using dealid grouping."""
-        product_spread_pairs = []
+    ) -> dict[ProductSpreadKey, list[list[SGXTrade]]]:
+        """Find exchange product spread pairs using dealid grouping.
+
+        Returns:
+            Pairs indexed by product set, contract month and quantity, in the
+            order they were found
+        """
+        unmatched_exchange = pool_manager.unmatched_exchange_ids
+        product_spread_pairs: dict[ProductSpreadKey, list[list[SGXTrade]]] = (
+            defaultdict(list)
+        )
+        product_spread_key = self._product_spread_key
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         # Group trades by dealid
         dealid_groups: dict[str, list[SGXTrade]] = defaultdict(list)
         for trade in exchange_trades:
-            if not pool_manager.is_unmatched(
-                trade.internal_trade_id, SGXTradeSource.EXCHANGE
-            ):
+            if trade.internal_trade_id not in unmatched_exchange:
                 continue
 
             # SGX trades have deal_id field directly
@@ -250,10 +293,13 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
                 if tradeid1 != tradeid2 and tradeid1 and tradeid2:
                     # Validate product spread characteristics
                     if self._validate_exchange_product_spread_pair(trade1, trade2):
-                        product_spread_pairs.append([trade1, trade2])
-                        logger.debug(
-                            f"Found dealid product spread pair: {tradeid1}/{tradeid2} (dealid: {dealid_str})"
+                        product_spread_pairs[product_spread_key(trade1, trade2)].append(
+                            [trade1, trade2]
                         )
+                        if debug_enabled:
+                            logger.debug(
+                                f"Found dealid product spread pair: {tradeid1}/{tradeid2} (dealid: {dealid_str})"
+                            )
             elif len(trades_in_group) > 2:
                 # Multiple legs - try to find all valid pairs
                 for i in range(len(trades_in_group)):
@@ -268,12 +314,15 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
                             if self._validate_exchange_product_spread_pair(
                                 trade1, trade2
                             ):
-                                product_spread_pairs.append([trade1, trade2])
-                                logger.debug(
-                                    f"Found dealid product spread pair: {tradeid1}/{tradeid2} (dealid: {dealid_str})"
-                                )
+                                product_spread_pairs[
+                                    product_spread_key(trade1, trade2)
+                                ].append([trade1, trade2])
+                                if debug_enabled:
+                                    logger.debug(
+                                        f"Found dealid product spread pair: {tradeid1}/{tradeid2} (dealid: {dealid_str})"
+                                    )
 
-        return product_spread_pairs
+        return dict(product_spread_pairs)
 
     def _validate_exchange_product_spread_pair(
         self, trade1: SGXTrade, trade2: SGXTrade
@@ -301,24 +350,30 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
     def _match_product_spread_pair(
         self,
         trader_pair: list[SGXTrade],
-        exchange_product_spread_pairs: list[list[SGXTrade]],
+        exchange_pair_index: dict[ProductSpreadKey, list[list[SGXTrade]]],
         pool_manager: SGXUnmatchedPool,
         confidence_tier: int = 1,
     ) -> Optional[SGXMatchResult]:
-        """Match a trader product spread pair with exchange product spread pairs."""
+        """Match a trader product spread pair with exchange product spread pairs.
+
+        Only exchange pairs with the trader pair's products, contract month and
+        quantity can pass _validate_product_spread_match, so just that bucket
+        of the index is scanned.
+        """
+        unmatched_exchange = pool_manager.unmatched_exchange_ids
         if len(trader_pair) != 2:
             return None
 
-        # Try to match with each exchange product spread pair
-        for exchange_pair in exchange_product_spread_pairs:
+        candidates = exchange_pair_index.get(self._product_spread_key(*trader_pair), [])
+
+        # Try to match with each candidate exchange product spread pair
+        for exchange_pair in candidates:
             if len(exchange_pair) != 2:
                 continue
 
             # Skip if either exchange trade is already matched
             if any(
-                not pool_manager.is_unmatched(
-                    trade.internal_trade_id, SGXTradeSource.EXCHANGE
-                )
+                trade.internal_trade_id not in unmatched_exchange
                 for trade in exchange_pair
             ):
                 continue
@@ -334,7 +389,11 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
     def _validate_product_spread_match(
         self, trader_trades: list[SGXTrade], exchange_trades: list[SGXTrade]
     ) -> bool:
-        """Validate that trader and exchange trades form a valid product spread match."""
+        """Validate that trader and exchange trades form a valid product spread match.
+
+        The exchange pair must come from _find_exchange_product_spread_pairs,
+        which has already checked it with _validate_exchange_product_spread_pair.
+        """
         if len(trader_trades) != 2 or len(exchange_trades) != 2:
             logger.debug("Product spread validation failed: incorrect number of trades")
             return False
@@ -349,15 +408,6 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
             logger.debug("Product spread validation failed: options/futures mismatch")
             return False
 
-        # Validate exchange trades form a valid product spread pair
-        if not self._validate_exchange_product_spread_pair(
-            exchange_trade1, exchange_trade2
-        ):
-            logger.debug(
-                "Product spread validation failed: invalid exchange product spread pair"
-            )
-            return False
-
         # Validate products match between trader and exchange
         trader_products = {trader_trade1.product_name, trader_trade2.product_name}
         exchange_products = {exchange_trade1.product_name, exchange_trade2.product_name}
@@ -551,7 +601,9 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
             "rule_number": self.rule_number,
             "rule_name": "Product Spread Match",
             "match_type": SGXMatchType.PRODUCT_SPREAD.value,
-            "confidence": float(self.confidence),
+            "confidence": self.config_manager.get_rule_confidence_float(
+                self.rule_number
+            ),
             "description": "Matches product spreads where trader shows calculated spread price for different products but exchange shows individual legs",
             "requirements": [
                 "Both sources must have 2 trades each (different products)",
@@ -573,13 +625,14 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
         pool_manager: SGXUnmatchedPool,
     ) -> list[SGXMatchResult]:
         """Find Tier 3 matches: hyphenated exchange spreads vs trader pairs (1-to-2)."""
+        unmatched_exchange = pool_manager.unmatched_exchange_ids
         matches: list[SGXMatchResult] = []
 
         # Filter exchange trades to only hyphenated products
         hyphenated_trades = [
             t
             for t in exchange_trades
-            if pool_manager.is_unmatched(t.internal_trade_id, SGXTradeSource.EXCHANGE)
+            if t.internal_trade_id in unmatched_exchange
             and "-" in t.product_name
             and self._parse_hyphenated_product(t.product_name) is not None
         ]
@@ -644,12 +697,11 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
         self, trader_trades: list[SGXTrade], pool_manager: SGXUnmatchedPool
     ) -> dict[tuple[str, ...], list[SGXTrade]]:
         """Create index of trader trades for hyphenated exchange matching."""
+        unmatched_trader = pool_manager.unmatched_trader_ids
         index: dict[tuple[str, ...], list[SGXTrade]] = defaultdict(list)
 
         for trade in trader_trades:
-            if pool_manager.is_unmatched(
-                trade.internal_trade_id, SGXTradeSource.TRADER
-            ):
+            if trade.internal_trade_id in unmatched_trader:
                 # Index by contract month, quantity, and universal fields (same as regular matching)
                 # Convert Decimal to float for consistent hashing
                 signature = self.create_universal_signature(
@@ -684,6 +736,7 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
         Returns:
             SGXMatchResult if match found, None otherwise
         """
+        unmatched_trader = pool_manager.unmatched_trader_ids
         # Parse the hyphenated product
         components = self._parse_hyphenated_product(exchange_trade.product_name)
         if not components:
@@ -721,9 +774,7 @@ class ProductSpreadMatcher(MultiLegBaseMatcher):
         second_trade = None
 
         for trade in matching_trades:
-            if pool_manager.is_unmatched(
-                trade.internal_trade_id, SGXTradeSource.TRADER
-            ):
+            if trade.internal_trade_id in unmatched_trader:
                 logger.debug(
                     f"Checking trader trade: {trade.internal_trade_id} - {trade.product_name} {trade.price} {trade.buy_sell}"
                 )
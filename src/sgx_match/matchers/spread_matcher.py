@@ -5,7 +5,7 @@ from decimal import Decimal
 import logging
 
 from ...unified_recon.models.recon_status import ReconStatus
-from ..models import SGXTrade, SGXMatchResult, SGXMatchType, SGXTradeSource, SignatureValue
+from ..models import SGXTrade, SGXMatchResult, SGXMatchType, SignatureValue
 from ..core import SGXUnmatchedPool
 from ..config import SGXConfigManager
 from ..normalizers import SGXTradeNormalizer
@@ -30,6 +30,7 @@ class SpreadMatcher(MultiLegBaseMatcher):
 
     def find_matches(self, pool_manager: SGXUnmatchedPool) -> list[SGXMatchResult]:
         """Find all spread matches using 2-tier sequential approach (dealid + time-based)."""
+        unmatched_trader = pool_manager.unmatched_trader_ids
         logger.info("Starting spread matching (Rule 2) - 2-tier sequential approach")
         matches = []
 
@@ -51,10 +52,7 @@ class SpreadMatcher(MultiLegBaseMatcher):
         for trader_pair in trader_spread_pairs:
             # Skip if any trader trade is already matched
             if any(
-                not pool_manager.is_unmatched(
-                    trade.internal_trade_id, SGXTradeSource.TRADER
-                )
-                for trade in trader_pair
+                trade.internal_trade_id not in unmatched_trader for trade in trader_pair
             ):
                 continue
 
@@ -78,14 +76,13 @@ class SpreadMatcher(MultiLegBaseMatcher):
         self, trader_trades: list[SGXTrade], pool_manager: SGXUnmatchedPool
     ) -> list[list[SGXTrade]]:
         """Find trader spread pairs with spread indicators."""
+        unmatched_trader = pool_manager.unmatched_trader_ids
         spread_pairs: list[list[SGXTrade]] = []
 
         # Group trades by product and quantity
         trade_groups: dict[tuple[SignatureValue, ...], list[SGXTrade]] = {}
         for trade in trader_trades:
-            if pool_manager.is_unmatched(
-                trade.internal_trade_id, SGXTradeSource.TRADER
-            ):
+            if trade.internal_trade_id in unmatched_trader:
                 # Convert Decimal to float for consistent hashing
                 key = self.create_universal_signature(
                     trade,
@@ -141,14 +138,13 @@ class SpreadMatcher(MultiLegBaseMatcher):
         Tier 1: DealID-based grouping (most accurate)
         Tier 2: Time-based grouping with price calculation matching (enhanced detection)
         """
+        unmatched_exchange = pool_manager.unmatched_exchange_ids
         logger.info("Starting 2-tier sequential spread grouping for SGX")
 
         # Initialize results
         all_spread_pairs: list[list[SGXTrade]] = []
         remaining_trades = [
-            t
-            for t in exchange_trades
-            if pool_manager.is_unmatched(t.internal_trade_id, SGXTradeSource.EXCHANGE)
+            t for t in exchange_trades if t.internal_trade_id in unmatched_exchange
         ]
 
         # Track tier statistics
@@ -231,14 +227,13 @@ class SpreadMatcher(MultiLegBaseMatcher):
         self, exchange_trades: list[SGXTrade], pool_manager: SGXUnmatchedPool
     ) -> list[list[SGXTrade]]:
         """Find exchange spread pairs using dealid/tradeid grouping (Tier 1 approach)."""
+        unmatched_exchange = pool_manager.unmatched_exchange_ids
         spread_pairs: list[list[SGXTrade]] = []
 
         # Group trades by dealid
         dealid_groups: dict[str, list[SGXTrade]] = {}
         for trade in exchange_trades:
-            if not pool_manager.is_unmatched(
-                trade.internal_trade_id, SGXTradeSource.EXCHANGE
-            ):
+            if trade.internal_trade_id not in unmatched_exchange:
                 continue
 
             # SGX trades have deal_id field directly (no raw_data access needed)
@@ -313,6 +308,7 @@ class SpreadMatcher(MultiLegBaseMatcher):
         Returns:
             List of validated spread pairs found using time-based approach
         """
+        unmatched_exchange = pool_manager.unmatched_exchange_ids
         spread_pairs: list[list[SGXTrade]] = []
 
         # Step 1: Group trades by exact same trade_time
@@ -337,10 +333,9 @@ class SpreadMatcher(MultiLegBaseMatcher):
                     trade1, trade2 = trades[i], trades[j]
 
                     # Skip if either trade is already matched
-                    if not pool_manager.is_unmatched(
-                        trade1.internal_trade_id, SGXTradeSource.EXCHANGE
-                    ) or not pool_manager.is_unmatched(
-                        trade2.internal_trade_id, SGXTradeSource.EXCHANGE
+                    if (
+                        trade1.internal_trade_id not in unmatched_exchange
+                        or trade2.internal_trade_id not in unmatched_exchange
                     ):
                         continue
 
@@ -425,6 +420,7 @@ class SpreadMatcher(MultiLegBaseMatcher):
         pool_manager: SGXUnmatchedPool,
     ) -> bool:
         """Check if there are trader spreads that match this exchange spread with calculated price."""
+        unmatched_trader = pool_manager.unmatched_trader_ids
         trader_trades = pool_manager.get_unmatched_trader_trades()
 
         # Look for trader spread pairs where:
@@ -437,10 +433,9 @@ class SpreadMatcher(MultiLegBaseMatcher):
             for j in range(i + 1, len(trader_trades)):
                 trader1, trader2 = trader_trades[i], trader_trades[j]
 
-                if not pool_manager.is_unmatched(
-                    trader1.internal_trade_id, SGXTradeSource.TRADER
-                ) or not pool_manager.is_unmatched(
-                    trader2.internal_trade_id, SGXTradeSource.TRADER
+                if (
+                    trader1.internal_trade_id not in unmatched_trader
+                    or trader2.internal_trade_id not in unmatched_trader
                 ):
                     continue
 
@@ -540,6 +535,7 @@ class SpreadMatcher(MultiLegBaseMatcher):
         pool_manager: SGXUnmatchedPool,
     ) -> Optional[SGXMatchResult]:
         """Match a trader spread pair with exchange spread pairs (Tier 1 approach)."""
+        unmatched_exchange = pool_manager.unmatched_exchange_ids
         if len(trader_pair) != 2:
             return None
 
@@ -550,9 +546,7 @@ class SpreadMatcher(MultiLegBaseMatcher):
 
             # Skip if either exchange trade is already matched
             if any(
-                not pool_manager.is_unmatched(
-                    trade.internal_trade_id, SGXTradeSource.EXCHANGE
-                )
+                trade.internal_trade_id not in unmatched_exchange
                 for trade in exchange_pair
             ):
                 continue
@@ -701,7 +695,9 @@ class SpreadMatcher(MultiLegBaseMatcher):
             "rule_number": self.rule_number,
             "rule_name": "Spread Match",
             "match_type": SGXMatchType.SPREAD.value,
-            "confidence": float(self.confidence),
+            "confidence": self.config_manager.get_rule_confidence_float(
+                self.rule_number
+            ),
             "description": "Matches spread trades where trader shows calculated spread but exchange shows individual legs",
             "requirements": [
                 "Both sources must have 2 trades each (spread legs)",
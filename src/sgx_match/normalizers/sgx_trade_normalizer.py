@@ -1,6 +1,5 @@
 """Trade data normalizer for SGX trades."""
 
-import re
 from typing import Any, Optional
 from decimal import Decimal, InvalidOperation
 import logging
@@ -22,7 +21,7 @@ class SGXTradeNormalizer:
         """
         self.config_manager = config_manager
         self._product_mappings = config_manager.get_product_mappings()
-        self._month_patterns = config_manager.get_month_patterns()
+        self._month_patterns = config_manager.get_compiled_month_patterns()
         self._buy_sell_mappings = config_manager.get_buy_sell_mappings()
 
         logger.info("Initialized SGX trade normalizer")
@@ -63,10 +62,10 @@ class SGXTradeNormalizer:
         cleaned = contract_month.strip()
 
         # Try pattern matching from config
-        for pattern, replacement in self._month_patterns.items():
-            match = re.match(pattern, cleaned)
+        for pattern, replacement in self._month_patterns:
+            match = pattern.match(cleaned)
             if match:
-                normalized = re.sub(pattern, replacement, cleaned)
+                normalized = pattern.sub(replacement, cleaned)
                 logger.debug(
                     f"Normalized contract month: '{contract_month}' -> '{normalized}'"
                 )
@@ -4,6 +4,14 @@ from typing import Optional
 import re
 from decimal import Decimal
 
+# Shared pool of (year, month_number) tuples so repeated months reuse one object
+_TUPLE_POOL: dict[tuple[int, int], tuple[int, int]] = {}
+
+
+def _intern(month_tuple: tuple[int, int]) -> tuple[int, int]:
+    """Return the pooled instance of a (year, month_number) tuple."""
+    return _TUPLE_POOL.setdefault(month_tuple, month_tuple)
+
 
 def get_month_order_tuple(contract_month: str) -> Optional[tuple[int, int]]:
     """Convert contract month to sortable tuple (year, month_number).
@@ -61,7 +69,7 @@ def get_month_order_tuple(contract_month: str) -> Optional[tuple[int, int]]:
         # Assume 20XX for years 00-99
         year = 2000 + year_suffix
 
-        return (year, month_num)
+        return _intern((year, month_num))
 
     except (ValueError, AttributeError):
         return None
@@ -0,0 +1,63 @@
+"""Tests for SGXConfigManager and SGXMatchingConfig."""
+
+import json
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from src.sgx_match.config import SGXConfigManager, config_manager
+from src.sgx_match.config.config_manager import SGXMatchingConfig
+
+CONFIG_DIR = Path(config_manager.__file__).parent
+
+
+def _orjson_loads() -> Callable[[bytes], Any]:
+    orjson = pytest.importorskip("orjson")
+    return orjson.loads  # type: ignore[no-any-return]
+
+
+@pytest.fixture(params=["json", "orjson"])
+def json_loads(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> Callable[[bytes], Any]:
+    loads = json.loads if request.param == "json" else _orjson_loads()
+    monkeypatch.setattr(config_manager, "_json_loads", loads)
+    return loads
+
+
+def test_shared_rule_confidence_levels_are_read_only() -> None:
+    first, second = SGXConfigManager(), SGXConfigManager()
+    assert first.matching_config is second.matching_config
+
+    with pytest.raises(TypeError):
+        first.matching_config.rule_confidence_levels[1] = Decimal("50")  # type: ignore[index]
+
+    assert second.get_rule_confidence(1) == Decimal("100")
+
+
+def test_explicit_rule_confidence_levels_are_read_only() -> None:
+    config = SGXMatchingConfig(rule_confidence_levels={1: Decimal("95")})
+
+    with pytest.raises(TypeError):
+        config.rule_confidence_levels[1] = Decimal("50")  # type: ignore[index]
+
+    assert config.model_dump()["rule_confidence_levels"] == {1: Decimal("95")}
+
+
+def test_json_parsers_load_normalizer_config_identically(
+    json_loads: Callable[[bytes], Any],
+) -> None:
+    expected = json.loads((CONFIG_DIR / "normalizer_config.json").read_bytes())
+
+    assert SGXConfigManager().normalizer_config == expected
+
+
+def test_invalid_normalizer_json_raises_value_error(
+    json_loads: Callable[[bytes], Any], tmp_path: Path
+) -> None:
+    (tmp_path / "normalizer_config.json").write_text("{not json")
+
+    with pytest.raises(ValueError, match="Invalid JSON in normalizer config"):
+        SGXConfigManager(tmp_path)
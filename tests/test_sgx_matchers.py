@@ -0,0 +1,252 @@
+"""Regression tests pinning the pairings produced by the SGX matchers.
+
+The expected pairings were recorded from the matchers before the indexed
+and bisect-based rewrites, so any change in which trades pair up fails here.
+"""
+
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from src.sgx_match.config import SGXConfigManager
+from src.sgx_match.core import SGXUnmatchedPool
+from src.sgx_match.core.trade_factory import SGXTradeFactory
+from src.sgx_match.matchers.exact_matcher import ExactMatcher
+from src.sgx_match.matchers.product_spread_matcher import ProductSpreadMatcher
+from src.sgx_match.matchers.spread_matcher import SpreadMatcher
+from src.sgx_match.models import SGXMatchResult, SGXTrade, SGXTradeSource
+from src.sgx_match.normalizers import SGXTradeNormalizer
+
+TRADER_COLUMNS = [
+    "internaltradeid",
+    "productname",
+    "contractmonth",
+    "quantityunit",
+    "price",
+    "b_s",
+    "spread",
+    "brokergroupid",
+    "exchclearingacctid",
+    "exchangegroupid",
+    "tradetime",
+]
+EXCHANGE_COLUMNS = [
+    "internaltradeid",
+    "productname",
+    "contractmonth",
+    "quantityunit",
+    "price",
+    "b_s",
+    "dealid",
+    "brokergroupid",
+    "exchclearingacctid",
+    "exchangegroupid",
+    "tradetime",
+]
+
+TRADER_ROWS = [
+    # Rule 1: exact, duplicate quantities, universal-field and same-side misses
+    ("T1", "FE", "Oct25", 15000, "101.65", "B", "", 3, 2, 1, "09:00:00"),
+    ("T2", "FE", "Nov25", 5000, "100", "S", "", 3, 2, 1, "09:01:00"),
+    ("T3", "FE", "Nov25", 5000, "100", "S", "", 3, 2, 1, "09:02:00"),
+    ("T4", "FE", "Nov25", 5000, "100", "S", "", 9, 2, 1, "09:03:00"),
+    ("T5", "FE", "Dec25", 6000, "99.5", "B", "", 3, 2, 1, "09:04:00"),
+    # Rule 2: calendar spreads (dealid tier, duplicates, time tier, same side)
+    ("T6", "FE", "Aug25", 155000, "-0.85", "B", "S", 3, 2, 1, "13:47:08"),
+    ("T7", "FE", "Dec25", 155000, "-0.85", "S", "S", 3, 2, 1, "13:47:09"),
+    ("T8", "FE", "Jan26", 20000, "1.5", "B", "S", 3, 2, 1, "13:50:00"),
+    ("T9", "FE", "Feb26", 20000, "1.5", "S", "S", 3, 2, 1, "13:50:01"),
+    ("T10", "FE", "Jan26", 20000, "1.5", "B", "S", 3, 2, 1, "13:51:00"),
+    ("T11", "FE", "Feb26", 20000, "1.5", "S", "S", 3, 2, 1, "13:51:01"),
+    ("T12", "FE", "Mar26", 30000, "0.5", "B", "S", 3, 2, 1, "14:00:00"),
+    ("T13", "FE", "Apr26", 30000, "0.5", "S", "S", 3, 2, 1, "14:00:01"),
+    ("T14", "FE", "May26", 40000, "2", "B", "S", 3, 2, 1, "14:10:00"),
+    ("T15", "FE", "Jun26", 40000, "2", "B", "S", 3, 2, 1, "14:10:01"),
+    # Rule 3: product spreads (PS tier, no-PS tier, same product, hyphenated)
+    ("T16", "M65", "Sep25", 10000, "15.65", "S", "PS", 3, 2, 1, "14:37:32"),
+    ("T17", "FE", "Sep25", 10000, "15.65", "B", "PS", 3, 2, 1, "14:37:32"),
+    ("T18", "M65", "Oct25", 8000, "14", "S", "", 3, 2, 1, "15:00:00"),
+    ("T19", "FE", "Oct25", 8000, "14", "B", "", 3, 2, 1, "15:00:00"),
+    ("T20", "M65", "Oct25", 8000, "14", "S", "", 3, 2, 1, "15:01:00"),
+    ("T21", "FE", "Oct25", 8000, "14", "B", "", 3, 2, 1, "15:01:00"),
+    ("T22", "FE", "Jul26", 7000, "5", "S", "PS", 3, 2, 1, "15:10:00"),
+    ("T23", "FE", "Jul26", 7000, "5", "B", "PS", 3, 2, 1, "15:10:00"),
+    ("T24", "bz", "Jul25", 1000, "178", "B", "", 3, 2, 1, "22:59:02"),
+    ("T25", "naphtha japan", "Jul25", 1000, "178", "S", "", 3, 2, 1, "22:59:02"),
+    ("T26", "M65", "Nov25", 9000, "12", "S", "PS", 3, 2, 1, "16:00:00"),
+    ("T27", "FE", "Nov25", 9000, "12", "B", "PS", 3, 2, 1, "16:00:00"),
+]
+
+EXCHANGE_ROWS = [
+    ("E1", "FE", "Oct25", 15000, "101.65", "B", "", 3, 2, 1, "09:00:00"),
+    ("E2", "FE", "Nov25", 5000, "100", "S", "", 3, 2, 1, "09:01:30"),
+    ("E3", "FE", "Nov25", 5000, "100", "S", "", 3, 2, 1, "09:02:30"),
+    ("E4", "FE", "Nov25", 5000, "100", "S", "", 3, 2, 1, "09:03:30"),
+    ("E5", "FE", "Dec25", 6000, "99.5", "S", "", 3, 2, 1, "09:04:30"),
+    ("E6", "FE", "Aug25", 155000, "101.80", "B", "1733680", 3, 2, 1, "13:47:00"),
+    ("E7", "FE", "Dec25", 155000, "102.65", "S", "1733680", 3, 2, 1, "13:47:00"),
+    ("E8", "FE", "Jan26", 20000, "101.5", "B", "1733700", 3, 2, 1, "13:50:00"),
+    ("E9", "FE", "Feb26", 20000, "100", "S", "1733700", 3, 2, 1, "13:50:00"),
+    ("E10", "FE", "Jan26", 20000, "101.5", "B", "1733701", 3, 2, 1, "13:51:00"),
+    ("E11", "FE", "Feb26", 20000, "100", "S", "1733701", 3, 2, 1, "13:51:00"),
+    ("E12", "FE", "Mar26", 30000, "100.5", "B", "", 3, 2, 1, "14:00:00"),
+    ("E13", "FE", "Apr26", 30000, "100", "S", "", 3, 2, 1, "14:00:00"),
+    ("E14", "FE", "May26", 40000, "102", "B", "1733710", 3, 2, 1, "14:10:00"),
+    ("E15", "FE", "Jun26", 40000, "100", "B", "1733710", 3, 2, 1, "14:10:00"),
+    ("E16", "FE", "Sep25", 10000, "103.10", "B", "1733632", 3, 2, 1, "14:37:00"),
+    ("E17", "M65", "Sep25", 10000, "118.75", "S", "1733632", 3, 2, 1, "14:37:00"),
+    ("E18", "FE", "Oct25", 8000, "100", "B", "1733640", 3, 2, 1, "15:00:00"),
+    ("E19", "M65", "Oct25", 8000, "114", "S", "1733640", 3, 2, 1, "15:00:00"),
+    ("E20", "FE", "Oct25", 8000, "100", "B", "1733641", 3, 2, 1, "15:01:00"),
+    ("E21", "M65", "Oct25", 8000, "114", "S", "1733641", 3, 2, 1, "15:01:00"),
+    ("E22", "FE", "Jul26", 7000, "105", "S", "1733650", 3, 2, 1, "15:10:00"),
+    ("E23", "FE", "Jul26", 7000, "100", "B", "1733650", 3, 2, 1, "15:10:00"),
+    (
+        "E24",
+        "bz-naphtha japan",
+        "Jul25",
+        1000,
+        "178",
+        "B",
+        "1733631",
+        3,
+        2,
+        1,
+        "22:59:00",
+    ),
+    ("E25", "FE", "Nov25", 9000, "100", "B", "1733660", 3, 2, 1, "16:00:00"),
+    ("E26", "M65", "Nov25", 9000, "112", "B", "1733660", 3, 2, 1, "16:00:00"),
+]
+
+Pairing = tuple[str, list[str], list[str], Decimal]
+
+EXACT_MATCHES: list[Pairing] = [
+    ("SGX_1", ["T1"], ["E1"], Decimal("100")),
+    # Duplicate quantity/price trades pair deterministically; T4 differs only
+    # in brokergroupid and T5/E5 only in side, so none of them match
+    ("SGX_1", ["T2"], ["E4"], Decimal("100")),
+    ("SGX_1", ["T3"], ["E3"], Decimal("100")),
+]
+SPREAD_MATCHES: list[Pairing] = [
+    ("SGX_2", ["T6", "T7"], ["E6", "E7"], Decimal("100")),
+    # Identical spreads pair in order
+    ("SGX_2", ["T8", "T9"], ["E8", "E9"], Decimal("100")),
+    ("SGX_2", ["T10", "T11"], ["E10", "E11"], Decimal("100")),
+    # No dealid: paired through the exchange trade time tier
+    ("SGX_2", ["T12", "T13"], ["E12", "E13"], Decimal("100")),
+]
+PRODUCT_SPREAD_MATCHES: list[Pairing] = [
+    ("SGX_3", ["T16", "T17"], ["E16", "E17"], Decimal("95")),
+    # No PS indicator; identical pairs are not cross-paired
+    ("SGX_3", ["T18", "T19"], ["E18", "E19"], Decimal("92")),
+    ("SGX_3", ["T20", "T21"], ["E20", "E21"], Decimal("92")),
+    # Hyphenated exchange product against two trader legs
+    ("SGX_3", ["T24", "T25"], ["E24"], Decimal("90")),
+]
+
+
+@pytest.fixture
+def config_manager() -> SGXConfigManager:
+    return SGXConfigManager()
+
+
+@pytest.fixture
+def normalizer(config_manager: SGXConfigManager) -> SGXTradeNormalizer:
+    return SGXTradeNormalizer(config_manager)
+
+
+@pytest.fixture
+def trades(normalizer: SGXTradeNormalizer) -> tuple[list[SGXTrade], list[SGXTrade]]:
+    factory = SGXTradeFactory(normalizer)
+    trader_df = pd.DataFrame(TRADER_ROWS, columns=TRADER_COLUMNS)
+    exchange_df = pd.DataFrame(
+        [(*row, "MT") for row in EXCHANGE_ROWS], columns=[*EXCHANGE_COLUMNS, "unit"]
+    )
+    trader_trades = factory.from_dataframe(trader_df, SGXTradeSource.TRADER)
+    exchange_trades = factory.from_dataframe(exchange_df, SGXTradeSource.EXCHANGE)
+    assert len(trader_trades) == len(TRADER_ROWS)
+    assert len(exchange_trades) == len(EXCHANGE_ROWS)
+    return trader_trades, exchange_trades
+
+
+def _pairings(matches: list[SGXMatchResult]) -> list[Pairing]:
+    assert len({match.match_id for match in matches}) == len(matches)
+    return [
+        (
+            match.match_id.rsplit("_", 1)[0],
+            [trade.internal_trade_id for trade in match.get_trader_trades()],
+            [trade.internal_trade_id for trade in match.get_exchange_trades()],
+            match.confidence,
+        )
+        for match in matches
+    ]
+
+
+def test_exact_matcher_pairings(
+    config_manager: SGXConfigManager,
+    trades: tuple[list[SGXTrade], list[SGXTrade]],
+) -> None:
+    matches = ExactMatcher(config_manager).find_matches(SGXUnmatchedPool(*trades))
+
+    assert _pairings(matches) == EXACT_MATCHES
+
+
+def test_spread_matcher_pairings(
+    config_manager: SGXConfigManager,
+    normalizer: SGXTradeNormalizer,
+    trades: tuple[list[SGXTrade], list[SGXTrade]],
+) -> None:
+    matcher = SpreadMatcher(config_manager, normalizer)
+
+    matches = matcher.find_matches(SGXUnmatchedPool(*trades))
+
+    # T14/T15 and E14/E15 are same-side pairs and never form a spread
+    assert _pairings(matches) == SPREAD_MATCHES
+
+
+def test_product_spread_matcher_pairings(
+    config_manager: SGXConfigManager,
+    normalizer: SGXTradeNormalizer,
+    trades: tuple[list[SGXTrade], list[SGXTrade]],
+) -> None:
+    matcher = ProductSpreadMatcher(config_manager, normalizer)
+
+    matches = matcher.find_matches(SGXUnmatchedPool(*trades))
+
+    # T22/T23 share a product and E25/E26 share a side, so neither pairs
+    assert _pairings(matches) == PRODUCT_SPREAD_MATCHES
+
+
+def test_rules_in_processing_order(
+    config_manager: SGXConfigManager,
+    normalizer: SGXTradeNormalizer,
+    trades: tuple[list[SGXTrade], list[SGXTrade]],
+) -> None:
+    pool = SGXUnmatchedPool(*trades)
+    matchers = {
+        1: ExactMatcher(config_manager),
+        2: SpreadMatcher(config_manager, normalizer),
+        3: ProductSpreadMatcher(config_manager, normalizer),
+    }
+
+    matches: list[SGXMatchResult] = []
+    for rule_number in config_manager.get_processing_order():
+        matches.extend(matchers[rule_number].find_matches(pool))
+
+    assert _pairings(matches) == (
+        EXACT_MATCHES + SPREAD_MATCHES + PRODUCT_SPREAD_MATCHES
+    )
+    assert sorted(t.internal_trade_id for t in pool.get_unmatched_trader_trades()) == [
+        "T14",
+        "T15",
+        "T22",
+        "T23",
+        "T26",
+        "T27",
+        "T4",
+        "T5",
+    ]
+    assert sorted(
+        t.internal_trade_id for t in pool.get_unmatched_exchange_trades()
+    ) == ["E14", "E15", "E2", "E22", "E23", "E25", "E26", "E5"]
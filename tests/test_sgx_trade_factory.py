@@ -0,0 +1,233 @@
+"""Tests for SGXTradeFactory loading behaviour."""
+
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.sgx_match.config import SGXConfigManager
+from src.sgx_match.core import trade_factory
+from src.sgx_match.core.trade_factory import SGXTradeFactory
+from src.sgx_match.models import SGXTradeSource
+from src.sgx_match.normalizers import SGXTradeNormalizer
+
+
+@pytest.fixture
+def factory() -> SGXTradeFactory:
+    return SGXTradeFactory(SGXTradeNormalizer(SGXConfigManager()))
+
+
+def _trader_rows(**overrides: list[object]) -> pd.DataFrame:
+    data: dict[str, list[object]] = {
+        "internaltradeid": ["1", "2", "3"],
+        "tradedate": ["2025-09-02"] * 3,
+        "tradetime": ["01:05:47 PM +00:00"] * 3,
+        "productname": ["fe"] * 3,
+        "quantityunit": [10000, 2000, 5000],
+        "price": [101.9, 101.85, 101.8],
+        "contractmonth": ["Oct25"] * 3,
+        "b_s": ["S", "B", "S"],
+        "exchangegroupid": [12, 12, 12],
+        "brokergroupid": ["1", "1", "1"],
+        "exchclearingacctid": [15, 15, 15],
+    }
+    data.update(overrides)
+    return pd.DataFrame(data)
+
+
+def test_bad_id_cell_skips_only_its_row(factory: SGXTradeFactory) -> None:
+    df = _trader_rows(brokergroupid=["1", "inf", "1"])
+
+    trades = factory.from_dataframe(df, SGXTradeSource.TRADER)
+
+    assert [t.internal_trade_id for t in trades] == ["1", "3"]
+    assert all(t.broker_group_id == 1 for t in trades)
+
+
+def test_normalizer_failure_skips_only_its_row(
+    factory: SGXTradeFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    normalize = factory.normalizer.normalize_contract_month
+
+    def failing_normalize(value: str) -> str:
+        if value == "bad":
+            raise ValueError("unparseable contract month")
+        return normalize(value)
+
+    monkeypatch.setattr(
+        factory.normalizer, "normalize_contract_month", failing_normalize
+    )
+    df = _trader_rows(contractmonth=["Oct25", "bad", "Oct25"])
+
+    trades = factory.from_dataframe(df, SGXTradeSource.TRADER)
+
+    assert [t.internal_trade_id for t in trades] == ["1", "3"]
+
+
+EXCHANGE_CSV = (
+    "\ufeffinternaltradeid,tradedate,tradetime,cleareddate,dealid,tradeid,"
+    "productname,quantitylot,quantityunit,unit,price,contractmonth,b_s,"
+    "exchangegroupid,brokergroupid,exchclearingacctid,strike,put_call\n"
+    "1149,2025-09-02,2025-09-02T09:31:00+00:00,2025-09-01T16:00:00+00:00,"
+    "0001739652,0003169895,fe,50,5000,MT,101.9,Oct25,S,12,5,17,,\n"
+    "1150,2025-09-03,2025-09-03T07:22:00,2025-09-02,"
+    ",0003169377,fe,,2000, MT ,0.5,Nov25,B,12,4,17,,NA\n"
+)
+
+
+@pytest.fixture(params=[False, True], ids=["c", "pyarrow"])
+def pyarrow_csv(request: pytest.FixtureRequest) -> bool:
+    if request.param:
+        pytest.importorskip("pyarrow")
+    return bool(request.param)
+
+
+def test_csv_keeps_dates_and_ids_as_text(
+    factory: SGXTradeFactory, tmp_path: Path, pyarrow_csv: bool
+) -> None:
+    csv_path = tmp_path / "exchange.csv"
+    csv_path.write_text(EXCHANGE_CSV, encoding="utf-8")
+
+    trade, _ = factory.from_csv(
+        csv_path, SGXTradeSource.EXCHANGE, pyarrow_csv=pyarrow_csv
+    )
+
+    assert trade.trade_date == "2025-09-02"
+    assert trade.trade_time == "2025-09-02T09:31:00+00:00"
+    assert trade.cleared_date == "2025-09-01T16:00:00+00:00"
+    assert trade.deal_id == 1739652
+
+
+def test_pyarrow_and_c_readers_return_identical_frames(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "exchange.csv"
+    csv_path.write_text(EXCHANGE_CSV, encoding="utf-8")
+
+    c_frame = SGXTradeFactory._read_csv(csv_path, None)
+    arrow_frame = SGXTradeFactory._read_csv(csv_path, None, pyarrow_csv=True)
+
+    pd.testing.assert_frame_equal(arrow_frame, c_frame)
+    assert arrow_frame["dealid"].tolist()[0] == "0001739652"
+
+
+def test_pyarrow_reader_falls_back_to_c_engine(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = tmp_path / "exchange.csv"
+    csv_path.write_text(EXCHANGE_CSV, encoding="utf-8")
+    monkeypatch.setattr(trade_factory, "_HAS_PYARROW", False)
+
+    def fail_pyarrow_read(*args: object) -> pd.DataFrame:
+        raise AssertionError("pyarrow reader used without pyarrow")
+
+    monkeypatch.setattr(SGXTradeFactory, "_read_csv_pyarrow", fail_pyarrow_read)
+
+    frame = SGXTradeFactory._read_csv(csv_path, None, pyarrow_csv=True)
+
+    pd.testing.assert_frame_equal(frame, SGXTradeFactory._read_csv(csv_path, None))
+
+
+def test_parquet_cache_without_pyarrow_reads_csv(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = tmp_path / "trader.csv"
+    _trader_rows().to_csv(csv_path, index=False)
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    df = SGXTradeFactory._read_cached_csv(csv_path, ["internaltradeid", "b_s"])
+
+    assert list(df.columns) == ["internaltradeid", "b_s"]
+    assert len(df) == 3
+    assert not csv_path.with_suffix(".parquet").exists()
+
+
+def test_parquet_cache_write_failure_falls_back_to_csv(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    csv_path = tmp_path / "trader.csv"
+    _trader_rows().to_csv(csv_path, index=False)
+
+    def fail_write_table(*args: object, **kwargs: object) -> None:
+        raise ValueError("cannot convert column")
+
+    monkeypatch.setattr(pq, "write_table", fail_write_table)
+
+    df = SGXTradeFactory._read_cached_csv(csv_path, ["internaltradeid", "b_s"])
+
+    assert len(df) == 3
+    assert list(tmp_path.iterdir()) == [csv_path]
+
+
+def test_parquet_cache_is_reused_while_csv_is_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "trader.csv"
+    _trader_rows().to_csv(csv_path, index=False)
+    expected = SGXTradeFactory._read_cached_csv(csv_path, ["internaltradeid"])
+
+    def fail_read_csv(*args: object) -> pd.DataFrame:
+        raise AssertionError("CSV re-read despite a fresh cache")
+
+    monkeypatch.setattr(SGXTradeFactory, "_read_csv", fail_read_csv)
+    cached = SGXTradeFactory._read_cached_csv(csv_path, ["internaltradeid"])
+
+    pd.testing.assert_frame_equal(cached, expected)
+
+
+def test_parquet_cache_ignores_copy_of_replaced_older_csv(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "trader.csv"
+    _trader_rows().to_csv(csv_path, index=False)
+    SGXTradeFactory._read_cached_csv(csv_path, ["internaltradeid"])
+    cache_mtime_ns = csv_path.with_suffix(".parquet").stat().st_mtime_ns
+
+    # Replace the CSV but keep an older timestamp, as cp -p or rsync -t would
+    _trader_rows(internaltradeid=["7", "8", "9"]).to_csv(csv_path, index=False)
+    old_ns = cache_mtime_ns - 60_000_000_000
+    os.utime(csv_path, ns=(old_ns, old_ns))
+
+    df = SGXTradeFactory._read_cached_csv(csv_path, ["internaltradeid"])
+
+    assert df["internaltradeid"].tolist() == [7, 8, 9]
+
+
+def _validation_rows() -> pd.DataFrame:
+    return _trader_rows(
+        internaltradeid=["1", "2", "3", "4", "5", "6", "7", "8", "9"],
+        tradedate=[" 2025-09-02 "] * 9,
+        tradetime=["01:05:47 PM +00:00 "] * 9,
+        productname=[" fe "] * 9,
+        quantityunit=["10000", "0", "-5", "inf", "2000", "3000", "4000", "5000", "10"],
+        price=["101.9", "101.9", "101.9", "101.9", "nan", "101.8", "101.7", "99", "1"],
+        contractmonth=["Oct25 "] * 9,
+        b_s=["S", "B", "S", "B", "S", "X", " b ", "S", "B"],
+        exchangegroupid=[12] * 9,
+        brokergroupid=["1"] * 9,
+        exchclearingacctid=[15] * 9,
+        quantitylot=["", "", "", "", "", "", "", "-1", ""],
+        unit=[" MT "] * 9,
+        strike=["", "", "", "", "", "", "", "", "inf"],
+        traderid=[" T1 "] * 9,
+    )
+
+
+def test_fast_and_validated_trade_building_agree() -> None:
+    def build(validate_trades: bool) -> list[dict[str, object]]:
+        factory = SGXTradeFactory(
+            SGXTradeNormalizer(SGXConfigManager()), validate_trades=validate_trades
+        )
+        trades = factory.from_dataframe(_validation_rows(), SGXTradeSource.TRADER)
+        return [trade.model_dump() for trade in trades]
+
+    fast, validated = build(False), build(True)
+
+    assert fast == validated
+    # Zero, negative and infinite quantities, NaN price, an unknown side and a
+    # negative lot count and an infinite strike are rejected by both
+    assert [trade["internal_trade_id"] for trade in fast] == ["1", "7"]
+    assert fast[0]["unit"] == "MT"
+    assert fast[0]["trader_id"] == "T1"